@@ -19,9 +19,13 @@ from varlord import Config, sources
 from varlord.validators import ValidationError, validate_not_empty, validate_range, validate_regex
 
 # Set environment variables for testing
-os.environ["DB__HOST"] = "localhost"
-os.environ["DB__PORT"] = "5432"
-os.environ["API__TIMEOUT"] = "30"
+os.environ.update(
+    {
+        "DB__HOST": "localhost",
+        "DB__PORT": "5432",
+        "API__TIMEOUT": "30",
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -39,24 +39,26 @@ def pytest_collection_modifyitems(config, items):
     """
     # Lazy dependency availability - only check when needed
     etcd_available = None  # Cache for etcd availability
+    etcd_markers = {"requires_etcd", "etcd"}
+    etcd_files = {}  # Cache of file path -> "file name suggests etcd"
 
     deselected = []
     selected = []
 
     for item in items:
         # Check if test requires etcd
-        requires_etcd = any(
-            marker.name == "requires_etcd" or marker.name == "etcd"
-            for marker in item.iter_markers()
-        )
+        requires_etcd = not etcd_markers.isdisjoint(m.name for m in item.iter_markers())
 
         # Check if test file name suggests it needs etcd
         if not requires_etcd:
             test_file = str(item.fspath)
-            if "etcd" in test_file.lower() and (
-                "test_etcd" in test_file or "etcd_integration" in test_file
-            ):
-                requires_etcd = True
+            file_requires_etcd = etcd_files.get(test_file)
+            if file_requires_etcd is None:
+                file_requires_etcd = "etcd" in test_file.lower() and (
+                    "test_etcd" in test_file or "etcd_integration" in test_file
+                )
+                etcd_files[test_file] = file_requires_etcd
+            requires_etcd = file_requires_etcd
 
         # Only check dependency availability if the test actually requires it
         should_deselect = False
@@ -111,8 +113,10 @@ def cleanup_files():
 
     # 清理
     for filepath in files_to_cleanup:
-        if os.path.exists(filepath):
+        try:
             os.remove(filepath)
+        except FileNotFoundError:
+            pass
 
 
 @pytest.fixture
@@ -64,8 +64,7 @@ def test_cli_case_normalization():
         assert app.port == 9999
 
         # Verify that output keys are lowercase (this is the key normalization)
-        cli_source = sources.CLI(model=AppConfig)
-        result = cli_source.load()
+        result = cfg._sources[0].load()
         # Output keys should always be lowercase for consistency
         assert all(k == k.lower() for k in result.keys())
     finally:
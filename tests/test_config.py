@@ -2,6 +2,10 @@
 Tests for Config class.
 """
 
+import sys
+
+import pytest
+
 from varlord import Config, sources
 
 
@@ -51,3 +55,143 @@ def test_config_priority(sample_config_model, monkeypatch):
 
     app = cfg.load()
     assert app.host == "env_value"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots requires 3.10+")
+def test_config_slotted_frozen_models(monkeypatch):
+    """Slotted, frozen models load without a per-instance __dict__."""
+    from dataclasses import dataclass, field
+
+    @dataclass(frozen=True, slots=True)
+    class DBConfig:
+        host: str = "localhost"
+        port: int = 5432
+
+    @dataclass(frozen=True, slots=True)
+    class AppConfig:
+        name: str = "app"
+        db: DBConfig = field(default_factory=DBConfig)
+
+    monkeypatch.setenv("DB__PORT", "6543")
+    cfg = Config(model=AppConfig, sources=[sources.Env()])
+
+    app = cfg.load()
+    assert isinstance(app, AppConfig)
+    assert isinstance(app.db, DBConfig)
+    assert app.db.port == 6543
+    assert not hasattr(app, "__dict__")
+    assert not hasattr(app.db, "__dict__")
+    assert cfg.to_dict() == {"name": "app", "db": {"host": "localhost", "port": 6543}}
+
+
+def test_config_load_reuses_unchanged_frozen_instance(monkeypatch):
+    """With reuse_instances, unchanged frozen configs are reused; changes are rebuilt."""
+    from dataclasses import dataclass, field
+
+    @dataclass(frozen=True)
+    class DBConfig:
+        host: str = "localhost"
+
+    @dataclass(frozen=True)
+    class FrozenConfig:
+        port: int = 8000
+        db: DBConfig = field(default_factory=DBConfig)
+
+    @dataclass
+    class MutableConfig:
+        port: int = 8000
+
+    monkeypatch.setenv("PORT", "9000")
+    cfg = Config(model=FrozenConfig, sources=[sources.Env()], reuse_instances=True)
+    first = cfg.load()
+    assert cfg.load() is first
+
+    monkeypatch.setenv("DB__HOST", "db.example.com")
+    second = cfg.load()
+    assert second is not first
+    assert second.db.host == "db.example.com"
+
+    # Off by default: every load() builds (and runs __post_init__ on) a new instance
+    default_cfg = Config(model=FrozenConfig, sources=[sources.Env()])
+    assert default_cfg.load() is not default_cfg.load()
+
+    mutable_cfg = Config(model=MutableConfig, sources=[sources.Env()], reuse_instances=True)
+    assert mutable_cfg.load() is not mutable_cfg.load()
+
+
+def test_config_signature_compares_nested_values_by_exact_type():
+    """Test that equal nested values of different types have different signatures."""
+    from dataclasses import dataclass
+
+    from varlord.metadata import _config_signature
+
+    @dataclass(frozen=True)
+    class DBConfig:
+        port: object = 1
+
+    assert _config_signature({"db": DBConfig(port=1)}) == _config_signature({"db": DBConfig(1)})
+    assert _config_signature({"db": DBConfig(port=1)}) != _config_signature(
+        {"db": DBConfig(port=True)}
+    )
+    assert _config_signature({"db": DBConfig(port=[1])}) is None
+
+
+def test_config_skips_leading_redundant_defaults_source(sample_config_model, monkeypatch):
+    """Test that an explicit leading Defaults source does not reload the base layer."""
+    monkeypatch.setenv("HOST", "env_value")
+    loads = []
+    defaults_load = sources.Defaults.load
+
+    def counting_load(self):
+        loads.append(self)
+        return defaults_load(self)
+
+    monkeypatch.setattr(sources.Defaults, "load", counting_load)
+
+    cfg = Config(
+        model=sample_config_model,
+        sources=[sources.Defaults(model=sample_config_model), sources.Env()],
+    )
+
+    app = cfg.load()
+    assert app.host == "env_value"
+    assert app.port == 8000
+    assert len(loads) == 1
+
+
+def test_nested_models_resolved_once_per_model():
+    """Test that nested dataclass fields (including Optional ones) are cached per model."""
+    from dataclasses import dataclass, field
+    from typing import Optional
+
+    from varlord.config import _get_nested_models
+
+    @dataclass(frozen=True)
+    class DBConfig:
+        host: str = "localhost"
+
+    @dataclass(frozen=True)
+    class AppConfig:
+        db: DBConfig = field(default_factory=DBConfig)
+        replica: Optional[DBConfig] = None
+        name: str = "app"
+
+    nested = _get_nested_models(AppConfig)
+    assert nested == {"db": DBConfig, "replica": DBConfig}
+    assert _get_nested_models(AppConfig) is nested
+
+
+def test_config_reuses_resolver_until_sources_change(sample_config_model, monkeypatch):
+    """Test that the resolver is rebuilt only when the source list changes."""
+    monkeypatch.setenv("HOST", "env-host")
+    cfg = Config(model=sample_config_model, sources=[sources.Env()])
+
+    assert cfg.load().host == "env-host"
+    resolver = cfg._resolver_cache[1]
+    cfg.load()
+    assert cfg._resolver_cache[1] is resolver
+
+    # Only the appended source can supply this value
+    cfg._sources.append(sources.CLI(model=sample_config_model, argv=["--host", "cli-host"]))
+    assert cfg.load().host == "cli-host"
+    assert cfg._resolver_cache[1] is not resolver
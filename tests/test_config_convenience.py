@@ -82,3 +82,16 @@ def test_from_model_priority():
         assert app.host == "env_value"
     finally:
         os.environ.pop("HOST", None)
+
+
+def test_from_model_returns_independent_configs():
+    """Repeated from_model calls share per-model caches but not sources."""
+    from varlord.sources.cli import _get_parser
+
+    cfg1 = Config.from_model(AppTestConfig, dotenv=None)
+    cfg2 = Config.from_model(AppTestConfig, dotenv=None)
+
+    assert cfg1 is not cfg2
+    assert all(s1 is not s2 for s1, s2 in zip(cfg1._sources, cfg2._sources))
+    # The argparse parser is built once per model, not once per Config
+    assert _get_parser(AppTestConfig) is _get_parser(AppTestConfig)
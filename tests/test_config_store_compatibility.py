@@ -87,3 +87,64 @@ def test_config_store_auto_defaults():
     config = store.get()
     assert config.host == "localhost"
     assert config.port == 8000
+
+
+def test_config_store_reload_keeps_unchanged_frozen_instance(monkeypatch):
+    """Test that reuse_instances keeps an unchanged frozen instance and notifies nobody."""
+
+    @dataclass(frozen=True)
+    class AppConfig:
+        host: str = "localhost"
+        port: int = 8000
+
+    cfg = Config(model=AppConfig, sources=[sources.Env()], reuse_instances=True)
+    store = cfg.load_store()
+    changes = []
+    store.subscribe(lambda config, diff: changes.append(diff))
+
+    first = store.get()
+    store.reload()
+    assert store.get() is first
+    assert changes == []
+
+    monkeypatch.setenv("PORT", "9000")
+    store.reload()
+    assert store.get() is not first
+    assert store.get().port == 9000
+    assert list(changes[0].modified) == ["port"]
+
+    # Off by default: reloads rebuild the instance but still notify only on changes
+    default_store = Config(model=AppConfig, sources=[sources.Env()]).load_store()
+    previous = default_store.get()
+    default_store.reload()
+    assert default_store.get() is not previous
+    assert default_store.get() == previous
+
+
+def test_config_store_nested_models(monkeypatch):
+    """Test that the store merges dotted keys into nested model defaults at every depth."""
+
+    @dataclass(frozen=True)
+    class CacheConfig:
+        enabled: bool = False
+        ttl: int = 60
+
+    @dataclass(frozen=True)
+    class DBConfig:
+        host: str = "localhost"
+        port: int = 5432
+        cache: CacheConfig = field(default_factory=CacheConfig)
+
+    @dataclass(frozen=True)
+    class AppConfig:
+        db: DBConfig = field(default_factory=DBConfig)
+        name: str = "app"
+
+    monkeypatch.setenv("DB__PORT", "6543")
+    monkeypatch.setenv("DB__CACHE__TTL", "7200")
+
+    store = Config(model=AppConfig, sources=[sources.Env()]).load_store()
+    config = store.get()
+
+    assert config.db == DBConfig(port=6543, cache=CacheConfig(ttl=7200))
+    assert config.name == "app"
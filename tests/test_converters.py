@@ -6,7 +6,7 @@ from typing import Optional, Union
 
 import pytest
 
-from varlord.converters import convert_value
+from varlord.converters import convert_value, get_converter
 
 
 def test_convert_int():
@@ -35,6 +35,9 @@ def test_convert_bool():
     assert convert_value("0", bool) is False
     assert convert_value("no", bool) is False
     assert convert_value("", bool) is False
+    assert convert_value("ON", bool) is True
+    assert convert_value("off", bool) is False
+    assert convert_value("maybe", bool) is True  # Unrecognized non-empty string
     assert convert_value(1, bool) is True
     assert convert_value(0, bool) is False
 
@@ -69,3 +72,46 @@ def test_convert_invalid():
     # Should raise ValueError for invalid float conversion
     with pytest.raises(ValueError):
         convert_value("not_a_number", float)
+
+
+def test_get_converter_matches_convert_value():
+    """Cached converters behave like convert_value."""
+    assert get_converter(int) is get_converter(int)
+
+    cases = [
+        ("123", int),
+        ("1.5", float),
+        ("yes", bool),
+        (True, int),
+        (None, int),
+        (42, str),
+        ("7", Optional[int]),
+        ('["a", "b"]', list),
+    ]
+    for value, target_type in cases:
+        assert get_converter(target_type)(value) == convert_value(value, target_type)
+
+    with pytest.raises(ValueError):
+        get_converter(int)("not-a-number")
+
+
+def test_get_converter_memoizes_string_inputs():
+    """Repeated string conversions reuse results; failures are raised every time."""
+    to_bool = get_converter(bool)
+    assert to_bool("off") is False
+    assert to_bool("off") is False
+    assert to_bool("ON") is True
+
+    to_int = get_converter(int)
+    assert to_int("8000") == 8000
+    assert to_int("8000") == 8000
+    assert to_int(True) is True  # non-string inputs bypass the memo
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            to_int("not-a-number")
+
+    # str targets skip the memo: strings pass through, other values convert
+    to_str = get_converter(str)
+    assert to_str("host") == "host"
+    assert to_str(8000) == "8000"
+    assert to_str(None) is None
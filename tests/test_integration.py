@@ -2,22 +2,17 @@
 Integration tests for the complete configuration system.
 """
 
-import os
-import sys
 from dataclasses import dataclass
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-from varlord import Config, PriorityPolicy, sources  # noqa: E402
+from varlord import Config, PriorityPolicy, sources
 
 # Mark all tests in this file as integration tests
 pytestmark = pytest.mark.integration
 
 
-def test_full_workflow():
+def test_full_workflow(monkeypatch):
     """Test complete configuration workflow."""
     from dataclasses import field
 
@@ -40,35 +35,29 @@ def test_full_workflow():
         )  # Use str instead of Optional[str]
 
     # Set environment variables
-    os.environ["HOST"] = "0.0.0.0"
-    os.environ["PORT"] = "9000"
-    os.environ["DEBUG"] = "true"
-    os.environ["TIMEOUT"] = "60.5"
-
-    try:
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-        )
+    monkeypatch.setenv("HOST", "0.0.0.0")
+    monkeypatch.setenv("PORT", "9000")
+    monkeypatch.setenv("DEBUG", "true")
+    monkeypatch.setenv("TIMEOUT", "60.5")
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+    )
 
-        app = cfg.load()
+    app = cfg.load()
 
-        assert app.host == "0.0.0.0"
-        assert app.port == 9000
-        assert app.debug is True
-        assert app.timeout == 60.5
-        assert app.api_key is None
+    assert app.host == "0.0.0.0"
+    assert app.port == 9000
+    assert app.debug is True
+    assert app.timeout == 60.5
+    assert app.api_key is None
 
-        print("✓ Full workflow test passed")
-    finally:
-        # Cleanup
-        for key in ["HOST", "PORT", "DEBUG", "TIMEOUT"]:
-            os.environ.pop(key, None)
+    print("✓ Full workflow test passed")
 
 
-def test_priority_workflow():
+def test_priority_workflow(monkeypatch):
     """Test priority ordering workflow."""
     from dataclasses import field
 
@@ -78,34 +67,30 @@ def test_priority_workflow():
             default="default",
         )
 
-    os.environ["VALUE"] = "env"
-
-    try:
-        # Test 1: Default priority (sources order - later overrides earlier)
-        # Defaults are automatically applied first, then Env
-        cfg1 = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),  # Overrides defaults
-            ],
-        )
-        app1 = cfg1.load()
-        assert app1.value == "env"
-
-        # Test 2: Only defaults (no env)
-        cfg2 = Config(
-            model=AppConfig,
-            sources=[],  # Only defaults
-        )
-        app2 = cfg2.load()
-        assert app2.value == "default"
-
-        print("✓ Priority workflow test passed")
-    finally:
-        os.environ.pop("VALUE", None)
-
-
-def test_per_key_priority():
+    monkeypatch.setenv("VALUE", "env")
+    # Test 1: Default priority (sources order - later overrides earlier)
+    # Defaults are automatically applied first, then Env
+    cfg1 = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),  # Overrides defaults
+        ],
+    )
+    app1 = cfg1.load()
+    assert app1.value == "env"
+
+    # Test 2: Only defaults (no env)
+    cfg2 = Config(
+        model=AppConfig,
+        sources=[],  # Only defaults
+    )
+    app2 = cfg2.load()
+    assert app2.value == "default"
+
+    print("✓ Priority workflow test passed")
+
+
+def test_per_key_priority(monkeypatch):
     """Test per-key priority policy."""
     from dataclasses import field
 
@@ -118,36 +103,28 @@ def test_per_key_priority():
             default="default-secret",
         )
 
-    os.environ["PUBLIC"] = "env-public"
-    os.environ["SECRET"] = "env-secret"
-
-    try:
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-            policy=PriorityPolicy(
-                default=["defaults", "env"],
-                overrides={
-                    "secret": ["defaults"],  # Secret should not use env
-                },
-            ),
-        )
+    monkeypatch.setenv("PUBLIC", "env-public")
+    monkeypatch.setenv("SECRET", "env-secret")
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+        policy=PriorityPolicy(
+            default=["defaults", "env"],
+            overrides={
+                "secret": ["defaults"],  # Secret should not use env
+            },
+        ),
+    )
 
-        app = cfg.load()
-        assert app.public == "env-public"
-        assert app.secret == "default-secret"
+    app = cfg.load()
+    assert app.public == "env-public"
+    assert app.secret == "default-secret"
 
-        print("✓ Per-key priority test passed")
-    finally:
-        os.environ.pop("PUBLIC", None)
-        os.environ.pop("SECRET", None)
+    print("✓ Per-key priority test passed")
 
 
 if __name__ == "__main__":
-    print("Running integration tests...")
-    test_full_workflow()
-    test_priority_workflow()
-    test_per_key_priority()
-    print("\n✅ All integration tests passed!")
+    # Tests use the monkeypatch fixture, so run them through pytest
+    raise SystemExit(pytest.main([__file__, "-v", "-m", "integration"]))
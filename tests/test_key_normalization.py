@@ -228,3 +228,28 @@ class TestDefaultsFieldValidation:
         config = source.load()
         assert "host" in config
         assert "port" in config
+
+
+def test_normalize_key_memoized():
+    """Test that normalize_key results are cached."""
+    normalize_key.cache_clear()
+    assert normalize_key("APP__DB__HOST") == "app.db.host"
+    assert normalize_key("APP__DB__HOST") == "app.db.host"
+    assert normalize_key.cache_info().hits == 1
+
+
+def test_normalized_keys_are_interned():
+    """Test that normalized keys share one object with the model's field keys."""
+    from varlord.metadata import get_all_fields_info
+
+    @dataclass
+    class DB:
+        host: str = "localhost"
+
+    @dataclass
+    class Model:
+        db: DB = field(default_factory=DB)
+
+    field_keys = {info.normalized_key: info.normalized_key for info in get_all_fields_info(Model)}
+    assert normalize_key("DB__HOST") is field_keys["db.host"]
+    assert normalize_key("".join(["D", "B"])) is field_keys["db"]
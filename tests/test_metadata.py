@@ -2,12 +2,15 @@
 Tests for metadata module.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+import pytest
 
 from varlord.metadata import (
     get_all_field_keys,
     get_all_fields_info,
     get_field_info,
+    get_raw_key_lookup,
 )
 
 
@@ -120,3 +123,62 @@ def test_get_field_info():
     assert field_info is not None
     assert field_info.normalized_key == "db.host"
     assert field_info.required is True
+
+
+def test_get_all_fields_info_cached_per_model():
+    """Test that field info is extracted once and shared across calls."""
+
+    @dataclass
+    class DBConfig:
+        host: str = field()
+
+    @dataclass
+    class AppConfig:
+        api_key: str = field()
+        db: DBConfig = field()
+
+    first = get_all_fields_info(AppConfig)
+    second = get_all_fields_info(AppConfig)
+
+    # Callers get their own list, backed by the same immutable FieldInfo objects
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    first.clear()
+    assert [f.normalized_key for f in get_all_fields_info(AppConfig)] == [
+        "api_key",
+        "db",
+        "db.host",
+    ]
+
+    with pytest.raises(AttributeError):
+        second[0].required = False
+    # The documented way to derive a modified copy
+    assert replace(second[0], required=False).required is False
+    assert get_all_fields_info(AppConfig)[0].required is True
+
+    assert get_all_field_keys(AppConfig) is get_all_field_keys(AppConfig)
+
+
+def test_get_raw_key_lookup():
+    """Test that raw key spellings map to the same keys normalize_key produces."""
+    from varlord.sources.base import normalize_key
+
+    @dataclass
+    class DBConfig:
+        host: str = field()
+
+    @dataclass
+    class AppConfig:
+        k8s_pod_name: str = field()
+        db: DBConfig = field()
+
+    lookup = get_raw_key_lookup(AppConfig)
+
+    assert lookup["db__host"] == "db.host"
+    assert lookup["db.host"] == "db.host"
+    assert lookup["k8s_pod_name"] == "k8s_pod_name"
+    assert "db_host" not in lookup
+    assert "other_var" not in lookup
+    for raw_key, normalized_key in lookup.items():
+        assert normalize_key(raw_key.upper()) == normalized_key
+    assert get_raw_key_lookup(AppConfig) is lookup
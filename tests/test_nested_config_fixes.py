@@ -130,6 +130,37 @@ class TestFlattenToNestedBugFix:
         assert app.ai.completion.retries == 5
         assert app.ai.embedding is None  # Optional field
 
+    def test_nested_dataclasses_constructed_once_per_load(self):
+        """Test that nested models are instantiated (and validated) once per load."""
+        post_init_calls = {"completion": 0, "ai": 0}
+
+        @dataclass
+        class CountingServiceConfig:
+            api_key: str = field()
+
+            def __post_init__(self):
+                post_init_calls["completion"] += 1
+
+        @dataclass
+        class CountingAIConfig:
+            completion: CountingServiceConfig = field()
+
+            def __post_init__(self):
+                post_init_calls["ai"] += 1
+
+        @dataclass
+        class CountingAppConfig:
+            ai: CountingAIConfig = field()
+
+        cfg = Config(
+            model=CountingAppConfig,
+            sources=[DictSource({"ai.completion.api_key": "sk-test123"})],
+        )
+        app = cfg.load()
+
+        assert app.ai.completion.api_key == "sk-test123"
+        assert post_init_calls == {"completion": 1, "ai": 1}
+
     def test_nested_with_optional_fields(self):
         """Test nested structure with optional fields."""
         config_dict = {
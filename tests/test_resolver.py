@@ -79,3 +79,63 @@ def test_resolver_deep_merge():
     assert result["nested"]["key1"] == "value1"
     assert result["nested"]["key2"] == "value2_override"
     assert result["nested"]["key3"] == "value3"
+
+
+def test_resolver_merge_mixed_value_kinds(caplog):
+    """Test that dicts and scalars override each other, with debug merge logging."""
+    import logging
+
+    from varlord.logging import set_log_level
+
+    source1 = MockSource("source1", {"a": "scalar", "b": {"x": 1}})
+    source2 = MockSource("source2", {"a": {"y": 2}, "b": "scalar"})
+
+    set_log_level(logging.DEBUG)
+    try:
+        with caplog.at_level(logging.DEBUG, logger="varlord"):
+            result = Resolver(sources=[source1, source2]).resolve()
+    finally:
+        set_log_level(logging.WARNING)
+
+    assert result == {"a": {"y": 2}, "b": "scalar"}
+    assert "Merged 'b' = 'scalar' from source 'source2'" in caplog.text
+
+
+def test_priority_policy_override_matching():
+    """Test that override patterns keep first-match-wins glob semantics."""
+    policy = PriorityPolicy(
+        default=["defaults", "env"],
+        overrides={
+            "db.*": ["defaults"],
+            "db.host": ["env"],  # Shadowed by the earlier "db.*" pattern
+            "secrets.*": ["etcd"],
+        },
+    )
+
+    assert policy.get_priority("db.host") == ["defaults"]
+    assert policy.get_priority("secrets.api_key") == ["etcd"]
+    assert policy.get_priority("dbhost") == ["defaults", "env"]
+    assert policy.get_priority("host") == ["defaults", "env"]
+    # Repeated lookups are served from the per-key cache
+    assert policy.get_priority("db.host") == ["defaults"]
+    assert policy == PriorityPolicy(default=["defaults", "env"], overrides=policy.overrides)
+
+
+def test_resolver_priority_policy_ids_and_names():
+    """Test PriorityPolicy merging with source IDs, shared names and unlisted sources."""
+    defaults = MockSource("defaults", {"host": "d", "db.host": "d", "extra": "d"})
+    system = MockSource("yaml", {"host": "sys", "db.host": "sys"}, source_id="yaml:/etc")
+    user = MockSource("yaml", {"host": "user"}, source_id="yaml:~")
+    env = MockSource("env", {"db.host": "env", "ignored": "x"})
+
+    policy = PriorityPolicy(
+        default=["defaults", "yaml"],
+        overrides={"db.*": ["env", "yaml:/etc"]},
+    )
+    resolver = Resolver(sources=[defaults, system, user, env], policy=policy)
+
+    assert resolver.resolve() == {
+        "host": "user",  # All "yaml" sources, in source order
+        "db.host": "sys",  # Exact ID listed after env
+        "extra": "d",
+    }
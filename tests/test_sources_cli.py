@@ -118,3 +118,79 @@ def test_cli_hyphen_underscore_both_work():
 
     # Both should work (argparse handles both)
     assert config1["host"] == "0.0.0.0"
+
+
+def test_cli_parser_reused_across_sources_and_loads():
+    """Test that the argument parser is built once per model and reused."""
+    from varlord.sources.cli import _get_parser
+
+    parser, _ = _get_parser(CLITestConfig)
+
+    first = CLI(model=CLITestConfig, argv=["--host", "a", "--port", "1"])
+    second = CLI(model=CLITestConfig, argv=["--host", "b", "--debug"])
+
+    assert first.load() == {"host": "a", "port": 1}
+    assert second.load() == {"host": "b", "debug": True}
+    # Parsing must not leak state between loads
+    assert first.load() == {"host": "a", "port": 1}
+    assert _get_parser(CLITestConfig)[0] is parser
+
+
+def test_cli_parse_results_memoized_per_argv(monkeypatch):
+    """Test that identical command lines are parsed once and results stay isolated."""
+    from varlord.sources import cli as cli_module
+
+    CLI.invalidate()
+    calls = []
+    parse_known_args = cli_module.argparse.ArgumentParser.parse_known_args
+
+    def counting_parse(self, *args, **kwargs):
+        calls.append(args)
+        return parse_known_args(self, *args, **kwargs)
+
+    monkeypatch.setattr(cli_module.argparse.ArgumentParser, "parse_known_args", counting_parse)
+
+    first = CLI(model=CLITestConfig, argv=["--host", "a"]).load()
+    first["host"] = "mutated"
+    second = CLI(model=CLITestConfig, argv=["--host", "a"]).load()
+    assert second == {"host": "a"}
+    assert len(calls) == 1
+
+    assert CLI(model=CLITestConfig, argv=["--host", "b"]).load() == {"host": "b"}
+    assert len(calls) == 2
+
+    CLI.invalidate()
+    CLI(model=CLITestConfig, argv=["--host", "a"]).load()
+    assert len(calls) == 3
+
+    @dataclass
+    class TagsConfig:
+        tags: list = field(default_factory=list)
+
+    CLI(model=TagsConfig, argv=["--tags", "ab"]).load()["tags"].append("mutated")
+    assert CLI(model=TagsConfig, argv=["--tags", "ab"]).load() == {"tags": ["a", "b"]}
+    assert len(calls) == 4
+
+
+def test_cli_skips_argparse_without_model_options(monkeypatch):
+    """Test that argv without any model option never reaches argparse."""
+    from varlord.sources import cli as cli_module
+
+    CLI.invalidate()
+    calls = []
+    parse_known_args = cli_module.argparse.ArgumentParser.parse_known_args
+
+    def counting_parse(self, *args, **kwargs):
+        calls.append(args)
+        return parse_known_args(self, *args, **kwargs)
+
+    monkeypatch.setattr(cli_module.argparse.ArgumentParser, "parse_known_args", counting_parse)
+
+    assert CLI(model=CLITestConfig, argv=["-q", "--verbose", "host", "--hos"]).load() == {}
+    assert calls == []
+
+    assert CLI(model=CLITestConfig, argv=["--port=9000", "--no-debug"]).load() == {
+        "port": 9000,
+        "debug": False,
+    }
+    assert len(calls) == 1
@@ -79,3 +79,41 @@ def test_defaults_precomputed():
     config = source.load()
     assert config["host"] == "precomputed"
     assert config["port"] == 9999
+
+
+def test_defaults_factories_run_per_load():
+    """Test that static defaults are cached but default factories run on every load."""
+
+    def broken_factory():
+        raise RuntimeError("boom")
+
+    @dataclass
+    class FactoryConfig:
+        tags: list = field(default_factory=list)
+        broken: dict = field(default_factory=broken_factory)
+        name: str = "app"
+
+    source = Defaults(model=FactoryConfig)
+    first = source.load()
+    second = source.load()
+
+    assert first == {"tags": [], "name": "app"}
+    assert list(first) == ["tags", "name"]
+    assert first["tags"] is not second["tags"]
+
+
+def test_defaults_without_factories_are_read_only():
+    """Test that factory-free defaults are served as a read-only view."""
+
+    @dataclass
+    class StaticConfig:
+        host: str = "localhost"
+        port: int = 8000
+
+    source = Defaults(model=StaticConfig)
+    config = source.load()
+
+    assert config == {"host": "localhost", "port": 8000}
+    with pytest.raises(TypeError):
+        config["host"] = "changed"  # type: ignore[index]
+    assert source.load()["host"] == "localhost"
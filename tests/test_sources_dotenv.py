@@ -141,3 +141,32 @@ def test_dotenv_empty_file():
         assert config == {}
     finally:
         os.unlink(env_file)
+
+
+def test_dotenv_parse_cached_until_file_changes(tmp_path, monkeypatch):
+    """Test that an unchanged .env file is parsed once."""
+    from varlord.sources import dotenv as dotenv_module
+
+    env_path = tmp_path / ".env"
+    env_path.write_text("API_KEY=first\n")
+    old = 1_000_000_000  # Far enough in the past to be cacheable
+    os.utime(env_path, (old, old))
+
+    calls = []
+    original = dotenv_module.dotenv_values
+
+    def counting_dotenv_values(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(dotenv_module, "dotenv_values", counting_dotenv_values)
+
+    source = DotEnv(str(env_path), model=DotEnvTestConfig)
+    assert source.load() == {"api_key": "first"}
+    assert source.load() == {"api_key": "first"}
+    assert len(calls) == 1
+
+    env_path.write_text("API_KEY=second\n")
+    os.utime(env_path, (old + 1, old + 1))
+    assert source.load() == {"api_key": "second"}
+    assert len(calls) == 2
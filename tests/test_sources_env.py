@@ -105,6 +105,18 @@ def test_env_prefix_case_insensitive(monkeypatch):
     assert config["port"] == "9000"
 
 
+def test_env_variable_names_case_insensitive(monkeypatch):
+    """Test that variable names match fields regardless of case."""
+    monkeypatch.setenv("Db__Host", "mixed-case")
+    monkeypatch.setenv("db__port", "6543")
+
+    source = Env(model=NestedTestConfig)
+    config = source.load()
+
+    assert config["db.host"] == "mixed-case"
+    assert config["db.port"] == "6543"
+
+
 def test_env_prefix_with_nested_keys(monkeypatch):
     """Test prefix with nested configuration keys."""
     monkeypatch.setenv("APP__DB__HOST", "db.example.com")
@@ -157,3 +169,25 @@ def test_env_repr_with_prefix():
 
     source2 = Env(model=EnvTestConfig, prefix="APP__")
     assert "prefix='APP__'" in repr(source2) or "APP__" in repr(source2)
+
+
+def test_env_reload_sees_updated_environment(monkeypatch):
+    """Test that each load() reads the live os.environ, not a value cached at an earlier load."""
+    monkeypatch.setenv("APP__HOST", "first")
+
+    source = Env(model=EnvTestConfig, prefix="APP__")
+    assert source.load()["host"] == "first"
+
+    monkeypatch.setenv("APP__HOST", "second")
+    monkeypatch.setenv("APP__PORT", "9000")
+    config = source.load()
+
+    assert config["host"] == "second"
+    assert config["port"] == "9000"
+
+
+def test_env_source_uses_slots():
+    """Test that Env instances carry no per-instance __dict__."""
+    source = Env(model=EnvTestConfig, prefix="APP__")
+    assert not hasattr(source, "__dict__")
+    assert source._prefix == "APP__"
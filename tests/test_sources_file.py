@@ -103,6 +103,62 @@ class TestJSONSource:
         finally:
             os.unlink(json_path)
 
+    def test_json_parse_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that an unchanged file is parsed once and cached values stay isolated."""
+
+        @dataclass(frozen=True)
+        class TagsConfig:
+            name: str = "app"
+            tags: list = field(default_factory=list)
+
+        json_path = tmp_path / "tags.json"
+        json_path.write_text('{"name": "a", "tags": ["x"]}', encoding="utf-8")
+        old = 1_000_000_000  # Far enough in the past to be cacheable
+        os.utime(json_path, (old, old))
+
+        calls = []
+        original = sources.JSON._load_file_content
+
+        def counting_load(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(sources.JSON, "_load_file_content", counting_load)
+
+        source = sources.JSON(str(json_path), model=TagsConfig)
+        first = source.load()
+        first["tags"].append("mutated")
+        assert source.load() == {"name": "a", "tags": ["x"]}
+        assert len(calls) == 1
+
+        json_path.write_text('{"name": "b", "tags": []}', encoding="utf-8")
+        os.utime(json_path, (old + 1, old + 1))
+        assert source.load() == {"name": "b", "tags": []}
+        assert len(calls) == 2
+
+    def test_parsed_file_cache_is_bounded(self, tmp_path):
+        """Test that the parsed-file cache evicts the least recently used file."""
+        from varlord.sources.file_base import _StatCache
+
+        cache = _StatCache(max_entries=2)
+        old = 1_000_000_000
+        stats = {}
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.json"
+            path.write_text("{}", encoding="utf-8")
+            os.utime(path, (old, old))
+            stats[name] = os.stat(path)
+
+        cache.put("a", stats["a"], 1)
+        cache.put("b", stats["b"], 2)
+        assert cache.get("a", stats["a"]) == 1  # "a" is now most recently used
+        cache.put("c", stats["c"], 3)
+
+        assert len(cache) == 2
+        assert cache.get("b", stats["b"]) is None
+        assert cache.get("a", stats["a"]) == 1
+        assert cache.get("c", stats["c"]) == 3
+
 
 class TestYAMLSource:
     """Tests for YAML source."""
@@ -330,3 +386,38 @@ class TestSourceIDSystem:
             assert json_source.id == expected_id
         finally:
             os.unlink(json_path)
+
+
+class TestLazySourceImports:
+    """Test that optional source modules are imported on first access."""
+
+    def test_import_varlord_does_not_load_file_sources(self):
+        """Test that importing varlord leaves optional backends unloaded."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, varlord\n"
+            "lazy = ['varlord.sources.yaml', 'varlord.sources.dotenv', 'varlord.sources.etcd']\n"
+            "assert not [m for m in lazy if m in sys.modules], sys.modules.keys()\n"
+            "from varlord.sources import YAML\n"
+            "assert 'varlord.sources.yaml' in sys.modules\n"
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_lazy_sources_listed_and_resolved(self):
+        """Test that lazy sources are exported and resolve to their classes."""
+        from varlord.sources.json import JSON
+
+        assert "JSON" in sources.__all__
+        assert "Etcd" in sources.__all__
+        assert sources.JSON is JSON
+        # Every exported name resolves, even without the optional backends
+        for name in sources.__all__:
+            assert getattr(sources, name) is not None
+        assert "YAML" in dir(sources)
+        assert not hasattr(sources, "NoSuchSource")
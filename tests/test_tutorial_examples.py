@@ -75,9 +75,8 @@ def test_getting_started_access():
 # ============================================================================
 
 
-def test_multiple_sources_priority():
+def test_multiple_sources_priority(monkeypatch):
     """Test source priority from multiple_sources.rst."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, sources
@@ -94,24 +93,19 @@ def test_multiple_sources_priority():
             default=False,
         )  # noqa: F821
 
-    try:
-        os.environ["HOST"] = "0.0.0.0"
-        os.environ["PORT"] = "9000"
-
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-        )
+    monkeypatch.setenv("HOST", "0.0.0.0")
+    monkeypatch.setenv("PORT", "9000")
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+    )
 
-        app = cfg.load()
-        assert app.host == "0.0.0.0"  # From env
-        assert app.port == 9000  # From env
-        assert app.debug is False  # From defaults
-    finally:
-        os.environ.pop("HOST", None)
-        os.environ.pop("PORT", None)
+    app = cfg.load()
+    assert app.host == "0.0.0.0"  # From env
+    assert app.port == 9000  # From env
+    assert app.debug is False  # From defaults
 
 
 def test_multiple_sources_cli():
@@ -152,9 +146,8 @@ def test_multiple_sources_cli():
         sys.argv = original_argv
 
 
-def test_multiple_sources_from_model():
+def test_multiple_sources_from_model(monkeypatch):
     """Test Config.from_model convenience method."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config
@@ -168,21 +161,16 @@ def test_multiple_sources_from_model():
             default=8000,
         )  # noqa: F821
 
-    try:
-        os.environ["HOST"] = "0.0.0.0"
-        os.environ["PORT"] = "9000"
-
-        cfg = Config.from_model(
-            model=AppConfig,
-            cli=False,
-        )
+    monkeypatch.setenv("HOST", "0.0.0.0")
+    monkeypatch.setenv("PORT", "9000")
+    cfg = Config.from_model(
+        model=AppConfig,
+        cli=False,
+    )
 
-        app = cfg.load()
-        assert app.host == "0.0.0.0"
-        assert app.port == 9000
-    finally:
-        os.environ.pop("PORT", None)
-        os.environ.pop("HOST", None)
+    app = cfg.load()
+    assert app.host == "0.0.0.0"
+    assert app.port == 9000
 
 
 # ============================================================================
@@ -231,9 +219,8 @@ def test_nested_configuration_basic():
     assert app.db.port == 5432
 
 
-def test_nested_configuration_env():
+def test_nested_configuration_env(monkeypatch):
     """Test nested configuration from environment variables."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, sources
@@ -262,26 +249,20 @@ def test_nested_configuration_env():
             default_factory=lambda: DBConfig(),
         )  # noqa: F821
 
-    try:
-        os.environ["DB__HOST"] = "db.example.com"
-        os.environ["DB__PORT"] = "3306"
-        os.environ["DB__DATABASE"] = "production"
-
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-        )
+    monkeypatch.setenv("DB__HOST", "db.example.com")
+    monkeypatch.setenv("DB__PORT", "3306")
+    monkeypatch.setenv("DB__DATABASE", "production")
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+    )
 
-        app = cfg.load()
-        assert app.db.host == "db.example.com"
-        assert app.db.port == 3306
-        assert app.db.database == "production"
-    finally:
-        os.environ.pop("PORT", None)
-        os.environ.pop("PORT", None)
-        os.environ.pop("PORT", None)
+    app = cfg.load()
+    assert app.db.host == "db.example.com"
+    assert app.db.port == 3306
+    assert app.db.database == "production"
 
 
 def test_nested_configuration_cli():
@@ -331,9 +312,8 @@ def test_nested_configuration_cli():
         sys.argv = original_argv
 
 
-def test_nested_configuration_deep():
+def test_nested_configuration_deep(monkeypatch):
     """Test deeply nested configuration."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, sources
@@ -368,23 +348,18 @@ def test_nested_configuration_deep():
             default_factory=lambda: DBConfig(),
         )  # noqa: F821
 
-    try:
-        os.environ["DB__CACHE__ENABLED"] = "true"
-        os.environ["DB__CACHE__TTL"] = "7200"
-
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-        )
+    monkeypatch.setenv("DB__CACHE__ENABLED", "true")
+    monkeypatch.setenv("DB__CACHE__TTL", "7200")
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+    )
 
-        app = cfg.load()
-        assert app.db.cache.enabled is True
-        assert app.db.cache.ttl == 7200
-    finally:
-        os.environ.pop("PORT", None)
-        os.environ.pop("PORT", None)
+    app = cfg.load()
+    assert app.db.cache.enabled is True
+    assert app.db.cache.ttl == 7200
 
 
 # ============================================================================
@@ -422,9 +397,8 @@ def test_validation_basic():
     assert app.port == 8000
 
 
-def test_validation_multiple_sources():
+def test_validation_multiple_sources(monkeypatch):
     """Test validation with multiple sources."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, sources
@@ -439,20 +413,16 @@ def test_validation_multiple_sources():
         def __post_init__(self):
             validate_port(self.port)
 
-    try:
-        os.environ["PORT"] = "70000"  # Invalid
-
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-        )
+    monkeypatch.setenv("PORT", "70000")  # Invalid
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+    )
 
-        with pytest.raises(ValidationError):
-            cfg.load()
-    finally:
-        os.environ.pop("PORT", None)
+    with pytest.raises(ValidationError):
+        cfg.load()
 
 
 def test_validation_nested():
@@ -567,9 +537,8 @@ def test_dynamic_updates_basic():
     assert app.port == 8000
 
 
-def test_dynamic_updates_manual_reload():
+def test_dynamic_updates_manual_reload(monkeypatch):
     """Test manual reload."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, sources
@@ -590,17 +559,13 @@ def test_dynamic_updates_manual_reload():
     store = cfg.load_store()
     assert store.get().port == 8000
 
-    try:
-        os.environ["PORT"] = "9000"
-        store.reload()
-        assert store.get().port == 9000
-    finally:
-        os.environ.pop("PORT", None)
+    monkeypatch.setenv("PORT", "9000")
+    store.reload()
+    assert store.get().port == 9000
 
 
-def test_dynamic_updates_subscribe():
+def test_dynamic_updates_subscribe(monkeypatch):
     """Test subscribing to configuration changes."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, sources
@@ -626,14 +591,11 @@ def test_dynamic_updates_subscribe():
     store = cfg.load_store()
     store.subscribe(on_config_change)
 
-    try:
-        os.environ["PORT"] = "9000"
-        store.reload()
-        assert len(changes) == 1
-        assert changes[0][0].port == 9000
-        assert "port" in changes[0][1].modified
-    finally:
-        os.environ.pop("PORT", None)
+    monkeypatch.setenv("PORT", "9000")
+    store.reload()
+    assert len(changes) == 1
+    assert changes[0][0].port == 9000
+    assert "port" in changes[0][1].modified
 
 
 # ============================================================================
@@ -641,9 +603,8 @@ def test_dynamic_updates_subscribe():
 # ============================================================================
 
 
-def test_advanced_priority_policy():
+def test_advanced_priority_policy(monkeypatch):
     """Test PriorityPolicy from advanced_features.rst."""
-    import os
     from dataclasses import dataclass, field
 
     from varlord import Config, PriorityPolicy, sources
@@ -660,34 +621,28 @@ def test_advanced_priority_policy():
             default="default-key",
         )  # noqa: F821
 
-    try:
-        os.environ["HOST"] = "env-host"
-        os.environ["PORT"] = "9000"
-        os.environ["API_KEY"] = "env-key"
-
-        policy = PriorityPolicy(
-            default=["defaults", "env"],
-            overrides={
-                "api_key": ["env", "defaults"],  # Defaults override env for api_key
-            },
-        )
+    monkeypatch.setenv("HOST", "env-host")
+    monkeypatch.setenv("PORT", "9000")
+    monkeypatch.setenv("API_KEY", "env-key")
+    policy = PriorityPolicy(
+        default=["defaults", "env"],
+        overrides={
+            "api_key": ["env", "defaults"],  # Defaults override env for api_key
+        },
+    )
 
-        cfg = Config(
-            model=AppConfig,
-            sources=[
-                sources.Env(model=AppConfig),
-            ],
-            policy=policy,
-        )
+    cfg = Config(
+        model=AppConfig,
+        sources=[
+            sources.Env(model=AppConfig),
+        ],
+        policy=policy,
+    )
 
-        app = cfg.load()
-        assert app.host == "env-host"
-        assert app.port == 9000
-        assert app.api_key == "default-key"  # Defaults override env per policy
-    finally:
-        os.environ.pop("PORT", None)
-        os.environ.pop("PORT", None)
-        os.environ.pop("PORT", None)
+    app = cfg.load()
+    assert app.host == "env-host"
+    assert app.port == 9000
+    assert app.api_key == "default-key"  # Defaults override env per policy
 
 
 def test_advanced_custom_source():
@@ -707,19 +662,34 @@ def test_advanced_custom_source():
         def __init__(self, file_path: str, source_id: str = None):
             super().__init__(source_id=source_id or f"json_file:{os.path.abspath(file_path)}")
             self._file_path = file_path
+            self._cached = None
+            self.parse_count = 0
 
         @property
         def name(self) -> str:
             return "json_file"
 
         def load(self) -> Mapping[str, Any]:
-            """Load configuration from JSON file."""
+            """Load configuration from JSON file, re-parsing only when it changes."""
+            try:
+                st = os.stat(self._file_path)
+            except FileNotFoundError:
+                return {}
+
+            signature = (st.st_mtime_ns, st.st_size)
+            if self._cached is not None and self._cached[0] == signature:
+                return dict(self._cached[1])
+
             try:
                 with open(self._file_path) as f:
                     data = json.load(f)
-                    return {k.lower(): v for k, v in data.items()}
-            except (FileNotFoundError, json.JSONDecodeError):
+            except json.JSONDecodeError:
                 return {}
+            self.parse_count += 1
+
+            result = {k.lower(): v for k, v in data.items()}
+            self._cached = (signature, result)
+            return dict(result)
 
     @dataclass  # noqa: F821
     class AppConfig:
@@ -735,15 +705,20 @@ def test_advanced_custom_source():
         json_path = f.name
 
     try:
+        source = JSONFileSource(json_path)
         cfg = Config(
             model=AppConfig,
             sources=[
-                JSONFileSource(json_path),
+                source,
             ],
         )
 
         app = cfg.load()
         assert app.host == "json-host"
         assert app.port == 7000
+
+        # Unchanged file: served from the stat-signature cache
+        assert cfg.load().port == 7000
+        assert source.parse_count == 1
     finally:
         os.unlink(json_path)
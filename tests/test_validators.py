@@ -10,6 +10,7 @@ import pytest
 from varlord.validators import (
     ValidationError,
     apply_validators,
+    compile_validators,
     validate_base64,
     validate_choice,
     # Custom
@@ -79,6 +80,19 @@ def test_validate_regex():
         validate_regex(123, r"^\d+$")  # Not a string
 
 
+def test_validate_regex_compiled_pattern_and_flags():
+    """Test validate_regex with precompiled patterns and flags."""
+    import re
+
+    pattern = re.compile(r"^[a-z]+\d+$")
+    validate_regex("abc123", pattern)
+    validate_regex("ABC123", r"^[a-z]+\d+$", re.IGNORECASE)
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_regex("ABC123", pattern)
+    assert repr(pattern.pattern) in exc_info.value.message
+
+
 def test_validate_choice():
     """Test validate_choice."""
     validate_choice("red", ["red", "green", "blue"])
@@ -519,6 +533,42 @@ def test_apply_validators():
     assert exc_info.value.key == "port" or exc_info.value.key == "email"
 
 
+def test_compile_validators():
+    """Test compile_validators builds a reusable validation function."""
+    from dataclasses import dataclass
+
+    calls = []
+
+    def record(value):
+        calls.append(value)
+
+    validate = compile_validators(
+        {
+            "port": [validate_port, record],
+            "email": [validate_email],
+            "missing": [validate_not_empty],
+            "host": [],
+        }
+    )
+
+    @dataclass
+    class TestConfig:
+        port: int = 8000
+        host: str = ""
+        email: str = "user@example.com"
+
+        def __post_init__(self):
+            validate(self)
+
+    TestConfig()
+    TestConfig(port=9000)
+    assert calls == [8000, 9000]
+
+    with pytest.raises(ValidationError) as exc_info:
+        TestConfig(email="invalid")
+    assert exc_info.value.key == "email"
+
+
 def test_validation_error():
     """Test ValidationError."""
     error = ValidationError("port", 70000, "must be between 1 and 65535")
@@ -6,14 +6,65 @@ Provides high-level API for loading and managing configuration.
 
 from __future__ import annotations
 
+import os
+import sys
+import weakref
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
-
+from typing import Any, Dict, Optional, Union, get_args, get_origin
+
+from varlord.converters import get_converter
+from varlord.logging import log_config_loaded
+from varlord.metadata import (
+    _config_signature,
+    _get_model_fields,
+    _is_frozen_model,
+    get_all_fields_info,
+)
+from varlord.model_validation import validate_config, validate_model_definition
 from varlord.policy import PriorityPolicy
 from varlord.resolver import Resolver
 from varlord.sources.base import Source
+from varlord.sources.cli import CLI
+from varlord.sources.defaults import Defaults, extract_defaults
 from varlord.store import ConfigStore
 
+# Per-model {field name: nested dataclass type} maps (Optional[T] unwrapped),
+# so loads never re-inspect field annotations.
+_NESTED_MODELS_CACHE: weakref.WeakKeyDictionary[type, Dict[str, type]] = weakref.WeakKeyDictionary()
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    """Return T for Optional[T] (Union[T, None]), else field_type unchanged."""
+    if get_origin(field_type) is Union:
+        args = get_args(field_type)
+        if type(None) in args:
+            non_none_types = [arg for arg in args if arg is not type(None)]
+            if non_none_types:
+                return non_none_types[0]
+    return field_type
+
+
+def _get_nested_models(model: type) -> Dict[str, type]:
+    """Return the (cached) mapping of nested dataclass field names to their types.
+
+    The returned dict is shared and must not be mutated.
+    """
+    if isinstance(model, type):
+        nested_models = _NESTED_MODELS_CACHE.get(model)
+        if nested_models is not None:
+            return nested_models
+
+    nested_models = {}
+    for name, f in _get_model_fields(model).items():
+        inner_type = _unwrap_optional(f.type)
+        if is_dataclass(inner_type):
+            nested_models[name] = inner_type
+
+    if isinstance(model, type):
+        _NESTED_MODELS_CACHE[model] = nested_models
+    return nested_models
+
 
 class Config:
     """Main configuration manager.
@@ -45,6 +96,7 @@ class Config:
         sources: list[Source],
         policy: Optional[PriorityPolicy] = None,
         show_source_help: bool = True,
+        reuse_instances: bool = False,
     ):
         """Initialize Config.
 
@@ -54,6 +106,10 @@ class Config:
                     later sources override earlier ones)
             policy: Optional PriorityPolicy for per-key priority rules
             show_source_help: Whether to show source mapping help in errors (default: True)
+            reuse_instances: Return the previous instance from load() when a frozen
+                    model's merged values are unchanged (default: False). The model's
+                    __post_init__ is then not rerun, so leave this off if it performs
+                    checks that depend on the environment (e.g. file existence).
 
         Raises:
             varlord.exceptions.ModelDefinitionError: If any field is missing required/optional metadata
@@ -69,10 +125,15 @@ class Config:
         self._sources = sources
         self._policy = policy
         self._show_source_help = show_source_help
+        self._reuse_instances = reuse_instances
+        # (signature of the last merged config dict, model instance built from it)
+        self._last_load: Optional[tuple[frozenset, Any]] = None
+        # Internal Defaults source, created on first use (see _create_defaults_source)
+        self._defaults_source: Optional[Defaults] = None
+        # (sources the resolver was built for, resolver), see _load_config_dict
+        self._resolver_cache: Optional[tuple[tuple[Source, ...], Resolver]] = None
 
         # Validate model definition first
-        from varlord.model_validation import validate_model_definition
-
         validate_model_definition(model)
 
         # Auto-inject model to sources that need it
@@ -163,39 +224,20 @@ class Config:
         Returns:
             Flat dictionary with normalized keys (e.g., {"host": "localhost", "db.host": "127.0.0.1"})
         """
-        from varlord.metadata import get_all_fields_info
-
-        defaults = {}
-        field_infos = get_all_fields_info(self._model)
-
-        for field_info in field_infos:
-            normalized_key = field_info.normalized_key
-
-            # Check for default value
-            if field_info.default is not ...:
-                defaults[normalized_key] = field_info.default
-            # Check for default_factory
-            elif field_info.default_factory is not ...:
-                try:
-                    defaults[normalized_key] = field_info.default_factory()
-                except Exception:
-                    pass  # Skip if factory fails
-
-        return defaults
+        return extract_defaults(self._model)
 
     def _create_defaults_source(self) -> Source:
         """Create an internal Defaults source from model defaults.
 
+        The model is fixed after __init__, so the source is created once and
+        shared by load(), load_store() and check_variables().
+
         Returns:
             A Source instance that returns model defaults.
         """
-        from varlord.sources.defaults import Defaults
-
-        # Create Defaults source with precomputed defaults
-        defaults_source = Defaults(model=self._model)
-        # Precompute defaults to avoid repeated extraction
-        defaults_source._precomputed_defaults = self._extract_model_defaults()
-        return defaults_source
+        if self._defaults_source is None:
+            self._defaults_source = Defaults(model=self._model)
+        return self._defaults_source
 
     def _load_config_dict(self, validate: bool = False) -> dict[str, Any]:
         """Load and merge configuration from all sources.
@@ -212,11 +254,29 @@ class Config:
         # Step 1: Create defaults source (internal, not in user's sources list)
         defaults_source = self._create_defaults_source()
 
-        # Step 2: Combine defaults + user sources
-        all_sources = [defaults_source] + self._sources
-
-        # Step 3: Create resolver with all sources
-        resolver = Resolver(sources=all_sources, policy=self._policy)
+        # Step 2: Combine defaults + user sources. A leading user Defaults
+        # source for the same model would only reload the same base layer
+        user_sources = self._sources
+        if user_sources:
+            first = user_sources[0]
+            if (
+                type(first) is Defaults
+                and first._model is self._model
+                and first._precomputed_defaults is None
+            ):
+                user_sources = user_sources[1:]
+        all_sources = [defaults_source] + user_sources
+
+        # Step 3: Create resolver with all sources, reusing the previous one
+        # while the source list and policy are unchanged (sources compare by
+        # identity, so appending to or replacing a source rebuilds it)
+        sources_key = tuple(all_sources)
+        cached = self._resolver_cache
+        if cached is not None and cached[0] == sources_key and cached[1]._policy is self._policy:
+            resolver = cached[1]
+        else:
+            resolver = Resolver(sources=all_sources, policy=self._policy)
+            self._resolver_cache = (sources_key, resolver)
 
         # Step 4: Resolve (merge all sources)
         config_dict = resolver.resolve()
@@ -242,8 +302,6 @@ class Config:
             config_dict = self._load_config_dict(validate=False)
 
         # Validate
-        from varlord.model_validation import validate_config
-
         validate_config(self._model, config_dict, self._sources, self._show_source_help)
 
     def handle_cli_commands(self) -> None:
@@ -268,7 +326,6 @@ class Config:
         # and exit early to avoid showing validation error after diagnostic table
         if cv_shown:
             config_dict_preview = self._load_config_dict(validate=False)
-            from varlord.metadata import get_all_fields_info
 
             # Check for missing required fields
             missing_fields = []
@@ -280,9 +337,6 @@ class Config:
 
             if missing_fields:
                 # Print a message before exiting
-                import os
-                import sys
-
                 print("")
                 print(f"⚠️  Missing required fields: {', '.join(missing_fields)}")
                 print("   Exiting with code 1. Please provide these fields and try again.")
@@ -307,12 +361,28 @@ class Config:
             use load_store() instead.
 
             For handling CLI commands (--help, --check-variables), call handle_cli_commands() first.
+
+            With reuse_instances=True, if the model and all nested models are
+            frozen dataclasses and the merged values (including their exact
+            types) are identical to the previous load, the previous instance
+            is returned without calling the model again.
         """
         # Load and merge configuration
         config_dict = self._load_config_dict(validate=validate)
 
+        if not self._reuse_instances:
+            return self._dict_to_model(config_dict)
+
+        # Reuse the previous instance when nothing changed (frozen models only)
+        signature = _config_signature(config_dict) if _is_frozen_model(self._model) else None
+        last_load = self._last_load
+        if signature is not None and last_load is not None and last_load[0] == signature:
+            return last_load[1]
+
         # Convert to model instance
-        return self._dict_to_model(config_dict)
+        instance = self._dict_to_model(config_dict)
+        self._last_load = (signature, instance) if signature is not None else None
+        return instance
 
     def load_store(self) -> ConfigStore:
         """Load configuration store (supports dynamic updates).
@@ -335,7 +405,9 @@ class Config:
         resolver = Resolver(sources=all_sources, policy=self._policy)
 
         # Create and return ConfigStore
-        return ConfigStore(resolver=resolver, model=self._model)
+        return ConfigStore(
+            resolver=resolver, model=self._model, reuse_instances=self._reuse_instances
+        )
 
     def _unwrap_optional_type(self, field_type: type) -> type:
         """Unwrap Optional[T] to get T.
@@ -354,17 +426,7 @@ class Config:
             >>> self._unwrap_optional_type(str)
             <class 'str'>
         """
-        from typing import Union, get_args, get_origin
-
-        origin = get_origin(field_type)
-        if origin is Union:
-            args = get_args(field_type)
-            if type(None) in args:
-                # Get the non-None type
-                non_none_types = [arg for arg in args if arg is not type(None)]
-                if non_none_types:
-                    return non_none_types[0]
-        return field_type
+        return _unwrap_optional(field_type)
 
     def _process_dataclass_instances(self, flat_dict: dict[str, Any]) -> dict[str, Any]:
         """Convert all dataclass instances in flat_dict to dicts.
@@ -373,17 +435,17 @@ class Config:
             flat_dict: Dictionary that may contain dataclass instances as values
 
         Returns:
-            Dictionary with all dataclass instances converted to dicts
+            Dictionary with all dataclass instances converted to dicts.
+            flat_dict itself is returned when it holds no dataclass instances.
         """
-        from dataclasses import asdict, is_dataclass
-
-        result = {}
+        result = None
         for key, value in flat_dict.items():
             if is_dataclass(type(value)):
+                # Copy lazily: most loads carry no dataclass values at all
+                if result is None:
+                    result = dict(flat_dict)
                 result[key] = asdict(value)
-            else:
-                result[key] = value
-        return result
+        return flat_dict if result is None else result
 
     def _process_flat_keys(
         self,
@@ -398,13 +460,12 @@ class Config:
             field_info: Dictionary mapping field names to field objects
             result: Result dictionary to populate
         """
-        from varlord.converters import convert_value
-
         for key, value in flat_dict.items():
-            if "." not in key and key in field_info:
-                field = field_info[key]
+            # Field names never contain dots, so dotted keys simply miss here
+            field = field_info.get(key)
+            if field is not None:
                 try:
-                    converted_value = convert_value(value, field.type, key=key)
+                    converted_value = get_converter(field.type)(value, key=key)
                     result[key] = converted_value
                 except (ValueError, TypeError):
                     result[key] = value
@@ -412,129 +473,86 @@ class Config:
     def _collect_nested_keys(
         self,
         flat_dict: dict[str, Any],
-        field_info: dict,
+        nested_models: dict[str, type],
     ) -> dict[str, dict[str, Any]]:
         """Collect all nested keys grouped by parent key.
 
         Args:
             flat_dict: Processed flat dictionary
-            field_info: Dictionary mapping field names to field objects
+            nested_models: Dictionary mapping nested field names to their dataclass types
 
         Returns:
             Dictionary mapping parent keys to their nested key-value pairs
         """
-        from dataclasses import is_dataclass
-
         nested_collections: dict[str, dict[str, Any]] = {}
         for key, value in flat_dict.items():
-            if "." in key:
-                parts = key.split(".", 1)
-                parent_key = parts[0]
-                child_key = parts[1]
-
-                if parent_key in field_info:
-                    field = field_info[parent_key]
-                    inner_type = self._unwrap_optional_type(field.type)
-
-                    if is_dataclass(inner_type):
-                        # Collect all nested keys for this parent
-                        if parent_key not in nested_collections:
-                            nested_collections[parent_key] = {}
-                        nested_collections[parent_key][child_key] = value
+            parent_key, dot, child_key = key.partition(".")
+            if dot:
+                if parent_key in nested_models:
+                    # Collect all nested keys for this parent
+                    if parent_key not in nested_collections:
+                        nested_collections[parent_key] = {}
+                    nested_collections[parent_key][child_key] = value
         return nested_collections
 
     def _process_nested_keys(
         self,
         nested_collections: dict[str, dict[str, Any]],
-        field_info: dict,
+        nested_models: dict[str, type],
         result: dict[str, Any],
     ) -> None:
-        """Process collected nested structures recursively.
+        """Merge collected nested keys into their parent dicts.
+
+        Child keys are merged as-is (they may still be dotted, e.g. "pool.size").
+        Type conversion and dataclass construction happen once, in
+        _convert_to_dataclasses(), so nested models are not instantiated (and
+        their ``__post_init__`` validation is not run) more than once per load.
 
         Args:
             nested_collections: Nested keys grouped by parent key
-            field_info: Dictionary mapping field names to field objects
+            nested_models: Dictionary mapping nested field names to their dataclass types
             result: Result dictionary to populate
         """
-        from dataclasses import asdict, is_dataclass
-
         for parent_key, nested_flat in nested_collections.items():
-            if parent_key not in field_info:
-                continue
-
-            field = field_info[parent_key]
-            inner_type = self._unwrap_optional_type(field.type)
-
-            if not is_dataclass(inner_type):
+            if parent_key not in nested_models:
                 continue
 
-            # Initialize parent dict if needed
-            if parent_key not in result:
-                result[parent_key] = {}
-            elif not isinstance(result[parent_key], dict):
-                result[parent_key] = {}
-
-            # Recursively process the complete nested structure
-            nested_result = self._flatten_to_nested(nested_flat, inner_type)
-
-            # Update result[parent_key] with nested_result
-            for nested_key, nested_value in nested_result.items():
-                if is_dataclass(type(nested_value)):
-                    result[parent_key][nested_key] = asdict(nested_value)
-                else:
-                    result[parent_key][nested_key] = nested_value
+            # Dotted child keys override whole-object values from the same layer.
+            # Build a new dict so a dict returned by a source is never mutated.
+            existing = result.get(parent_key)
+            if isinstance(existing, dict):
+                result[parent_key] = {**existing, **nested_flat}
+            else:
+                result[parent_key] = dict(nested_flat)
 
     def _convert_to_dataclasses(
         self,
         result: dict[str, Any],
-        field_info: dict,
+        nested_models: dict[str, type],
     ) -> None:
         """Convert nested dicts to dataclass instances with type conversion.
 
         Args:
             result: Result dictionary with nested dicts
-            field_info: Dictionary mapping field names to field objects
+            nested_models: Dictionary mapping nested field names to their dataclass types
         """
-        from dataclasses import asdict, fields, is_dataclass
-
-        from varlord.converters import convert_value
-
         for key, value in list(result.items()):
-            if key not in field_info:
+            inner_type = nested_models.get(key)
+            if inner_type is None or not isinstance(value, dict):
                 continue
 
-            field = field_info[key]
-            inner_type = self._unwrap_optional_type(field.type)
-
-            if not is_dataclass(inner_type) or not isinstance(value, dict):
-                continue
-
-            # Convert any dataclass instances in value to dicts
-            value_dict = {}
-            for nested_key, nested_value in value.items():
-                if is_dataclass(type(nested_value)):
-                    value_dict[nested_key] = asdict(nested_value)
-                else:
-                    value_dict[nested_key] = nested_value
-
-            # Recursively process and convert types
-            nested_instance = self._flatten_to_nested(value_dict, inner_type)
+            # Recursively process and convert types. The recursion converts
+            # dataclass values and dotted child keys (e.g. "pool.size") itself,
+            # and its leaf values come back already converted.
+            nested_instance = self._flatten_to_nested(value, inner_type)
 
             # Filter out init=False fields
-            init_fields = {f.name: f for f in fields(inner_type) if getattr(f, "init", True)}
-            filtered_instance = {k: v for k, v in nested_instance.items() if k in init_fields}
-
-            # Convert all values to correct types
-            nested_fields = {f.name: f for f in fields(inner_type)}
-            for nested_key, nested_value in filtered_instance.items():
-                if nested_key in nested_fields:
-                    nested_field = nested_fields[nested_key]
-                    try:
-                        filtered_instance[nested_key] = convert_value(
-                            nested_value, nested_field.type, key=f"{key}.{nested_key}"
-                        )
-                    except (ValueError, TypeError):
-                        pass
+            nested_fields = _get_model_fields(inner_type)
+            filtered_instance = {
+                k: v
+                for k, v in nested_instance.items()
+                if k in nested_fields and nested_fields[k].init
+            }
 
             result[key] = inner_type(**filtered_instance)
 
@@ -550,8 +568,6 @@ class Config:
         Returns:
             Model instance
         """
-        from dataclasses import is_dataclass
-
         if not is_dataclass(self._model):
             raise TypeError(f"Model must be a dataclass, got {type(self._model)}")
 
@@ -559,12 +575,7 @@ class Config:
         nested_dict = self._flatten_to_nested(config_dict, self._model)
 
         # Log successful load
-        try:
-            from varlord.logging import log_config_loaded
-
-            log_config_loaded(self._model.__name__, list(nested_dict.keys()))
-        except ImportError:
-            pass
+        log_config_loaded(self._model.__name__, nested_dict.keys())
 
         # Create model instance
         # Validation should be done in model's __post_init__ method
@@ -584,10 +595,9 @@ class Config:
         Returns:
             Nested dictionary matching the model structure
         """
-        from dataclasses import fields
-
-        # Get field info
-        field_info = {f.name: f for f in fields(model)}
+        # Get field info (both maps are cached per model)
+        field_info = _get_model_fields(model)
+        nested_models = _get_nested_models(model)
         result: dict[str, Any] = {}
 
         # Step 1: Convert all dataclass instances to dicts
@@ -596,12 +606,16 @@ class Config:
         # Step 2: Process flat (non-nested) keys
         self._process_flat_keys(flat_dict_processed, field_info, result)
 
+        # Flat models (the common case) have nothing left to group or build
+        if not nested_models:
+            return result
+
         # Step 3: Collect and process nested keys
-        nested_collections = self._collect_nested_keys(flat_dict_processed, field_info)
-        self._process_nested_keys(nested_collections, field_info, result)
+        nested_collections = self._collect_nested_keys(flat_dict_processed, nested_models)
+        self._process_nested_keys(nested_collections, nested_models, result)
 
         # Step 4: Convert nested dicts to dataclass instances
-        self._convert_to_dataclasses(result, field_info)
+        self._convert_to_dataclasses(result, nested_models)
 
         return result
 
@@ -618,8 +632,6 @@ class Config:
         Returns:
             Formatted help text string, or empty string if no CLI source found
         """
-        from varlord.sources.cli import CLI
-
         # Find CLI source
         cli_source = None
         for source in self._sources:
@@ -650,9 +662,6 @@ class Config:
         Returns:
             Formatted string with standard options
         """
-        import os
-        import sys
-
         if prog is None:
             prog = os.path.basename(sys.argv[0]) if sys.argv else "app.py"
 
@@ -737,8 +746,6 @@ class Config:
             - Source (defaults/env/cli/dotenv/etc)
             - Value (if loaded)
         """
-        from varlord.metadata import get_all_fields_info
-
         # Get all field info
         field_infos = get_all_fields_info(self._model)
 
@@ -1038,8 +1045,6 @@ class Config:
             If help is shown and exit_on_help=True, the program will exit.
             If check_variables is shown and exit_on_check_variables=True, the program will exit.
         """
-        import sys
-
         help_shown = False
         check_variables_shown = False
 
@@ -1068,8 +1073,6 @@ class Config:
         Returns:
             List of FieldInfo objects for all fields (including nested)
         """
-        from varlord.metadata import get_all_fields_info
-
         return get_all_fields_info(self._model)
 
     def to_dict(self, validate: bool = True) -> dict[str, Any]:
@@ -1086,8 +1089,6 @@ class Config:
             >>> config_dict = cfg.to_dict()
             >>> print(config_dict["host"])
         """
-        from dataclasses import asdict, is_dataclass
-
         # Load config and convert to model instance first
         config_obj = self.load(validate=validate)
         # Convert dataclass instance to dict (handles nested dataclasses)
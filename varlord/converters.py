@@ -8,7 +8,8 @@ appropriate Python types based on model field types.
 from __future__ import annotations
 
 import json
-from typing import Any, Optional, Type, get_args, get_origin
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type, get_args, get_origin
 
 try:
     from varlord.logging import log_type_conversion
@@ -67,14 +68,9 @@ def convert_value(value: Any, target_type: Type[Any], key: Optional[str] = None)
         return None
 
     # Convert based on target type
-    if target_type is bool:
-        result = _convert_bool(value)
-    elif target_type is int:
-        result = _convert_int(value)
-    elif target_type is float:
-        result = _convert_float(value)
-    elif target_type is str:
-        result = str(value)
+    scalar = _SCALAR_CONVERTERS.get(target_type)
+    if scalar is not None:
+        result = scalar(value)
     else:
         # For other types, try JSON parsing if it's a string
         if isinstance(value, str):
@@ -92,18 +88,95 @@ def convert_value(value: Any, target_type: Type[Any], key: Optional[str] = None)
     return result
 
 
+# Upper bound on memoized string conversions per scalar type. Config values
+# repeat across loads, so the memo stays small in practice; it is cleared
+# rather than grown if a caller feeds it unbounded distinct strings.
+_STRING_MEMO_MAX_ENTRIES = 1024
+
+
+def get_converter(target_type: Type[Any]) -> Callable[..., Any]:
+    """Return a converter function for ``target_type``.
+
+    The returned callable has the signature ``(value, key=None)`` and behaves
+    exactly like ``convert_value(value, target_type, key=key)``. Converters
+    are cached per type, and the common scalar types (bool, int, float, str)
+    get a direct converter that skips the typing introspection done by
+    :func:`convert_value`.
+
+    Args:
+        target_type: Target type
+
+    Returns:
+        Converter callable for the target type
+    """
+    try:
+        return _get_converter(target_type)
+    except TypeError:
+        # Unhashable annotation; fall back to the generic path
+        return _make_converter(target_type)
+
+
+@lru_cache(maxsize=None)
+def _get_converter(target_type: Type[Any]) -> Callable[..., Any]:
+    return _make_converter(target_type)
+
+
+def _make_converter(target_type: Type[Any]) -> Callable[..., Any]:
+    """Build a converter for ``target_type`` (see :func:`get_converter`)."""
+    scalar = _SCALAR_CONVERTERS.get(target_type) if isinstance(target_type, type) else None
+    if scalar is None:
+
+        def convert(value: Any, key: Optional[str] = None) -> Any:
+            return convert_value(value, target_type, key=key)
+
+        return convert
+
+    if target_type is str:
+        # String inputs are returned as-is, so a memo would never be consulted
+        def convert_str(value: Any, key: Optional[str] = None) -> Any:
+            if isinstance(value, str) or value is None:
+                return value
+            result = scalar(value)
+            if key:
+                log_type_conversion(key, value, target_type, result)
+            return result
+
+        return convert_str
+
+    # Successful conversions of string inputs, e.g. "8000" -> 8000. Keyed by
+    # the string alone, so values that merely compare equal (1, True, 1.0)
+    # never share an entry. Failed conversions are not memoized.
+    memo: Dict[str, Any] = {}
+
+    def convert_scalar(value: Any, key: Optional[str] = None) -> Any:
+        if isinstance(value, target_type):
+            return value
+        if value is None:
+            return None
+        if isinstance(value, str):
+            result = memo.get(value, memo)
+            if result is memo:
+                result = scalar(value)
+                if len(memo) >= _STRING_MEMO_MAX_ENTRIES:
+                    memo.clear()
+                memo[value] = result
+        else:
+            result = scalar(value)
+        if key:
+            log_type_conversion(key, value, target_type, result)
+        return result
+
+    return convert_scalar
+
+
 def _convert_bool(value: Any) -> bool:
     """Convert value to boolean."""
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        lower = value.lower()
-        if lower in ("true", "1", "yes", "on"):
-            return True
-        if lower in ("false", "0", "no", "off", ""):
-            return False
-    if isinstance(value, (int, float)):
-        return bool(value)
+        result = _BOOL_STRINGS.get(value.lower())
+        if result is not None:
+            return result
     return bool(value)
 
 
@@ -137,3 +210,23 @@ def _convert_float(value: Any) -> float:
         except ValueError:
             raise ValueError(f"Cannot convert {value!r} to float")
     raise TypeError(f"Cannot convert {type(value)} to float")
+
+
+_BOOL_STRINGS: Dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+    "": False,
+}
+
+_SCALAR_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    bool: _convert_bool,
+    int: _convert_int,
+    float: _convert_float,
+    str: str,
+}
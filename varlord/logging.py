@@ -8,7 +8,7 @@ merging, and type conversion.
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Collection, Optional
 
 # Default logger
 _logger: Optional[logging.Logger] = None
@@ -97,12 +97,12 @@ def log_validation_error(key: str, value: Any, error: str) -> None:
     logger.warning(f"Validation failed for '{key}' = {value!r}: {error}")
 
 
-def log_config_loaded(model_name: str, keys: list[str]) -> None:
+def log_config_loaded(model_name: str, keys: Collection[str]) -> None:
     """Log successful configuration load.
 
     Args:
         model_name: Name of the configuration model
-        keys: List of loaded configuration keys
+        keys: Loaded configuration keys (any sized collection, e.g. a keys view)
     """
     logger = get_logger()
     if logger.isEnabledFor(logging.INFO):
@@ -7,13 +7,48 @@ including metadata, types, defaults, and normalized keys.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, fields, is_dataclass
-from typing import Any, List, Optional, Set, Type
+import itertools
+import sys
+import weakref
+from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from varlord.sources.base import normalize_key
 
-
-@dataclass
+# Per-model caches for field introspection. Dataclass definitions do not change
+# after class creation, so the extracted field information can be reused by every
+# source and every Config built on the same model. Weak keys let locally defined
+# models (e.g., in tests) be garbage collected.
+_FIELDS_INFO_CACHE: weakref.WeakKeyDictionary[type, Tuple[FieldInfo, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+_FIELD_KEYS_CACHE: weakref.WeakKeyDictionary[type, FrozenSet[str]] = weakref.WeakKeyDictionary()
+_RAW_KEY_LOOKUP_CACHE: weakref.WeakKeyDictionary[type, Dict[str, str]] = weakref.WeakKeyDictionary()
+# {field name: Field} per model, for code that rebuilds model instances
+_MODEL_FIELDS_CACHE: weakref.WeakKeyDictionary[type, Dict[str, Field]] = weakref.WeakKeyDictionary()
+# Per-model "model and all nested models are frozen dataclasses" flags
+_FROZEN_MODEL_CACHE: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
+# Value types a merged configuration may contain for a previously built frozen
+# instance to be reused (they are immutable, so an equal dict builds an equal
+# model). Matched exactly: subclasses may carry extra state.
+_IMMUTABLE_VALUE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+@dataclass(frozen=True)
 class FieldInfo:
     """Information about a dataclass field.
 
@@ -27,6 +62,10 @@ class FieldInfo:
         optional: True if field is optional (from metadata)
         description: Field description from metadata
         help: Help text from metadata (for CLI)
+
+    Note:
+        Instances are cached per model class and shared, so they are frozen.
+        Use ``dataclasses.replace()`` to derive a modified copy.
     """
 
     name: str
@@ -43,6 +82,9 @@ class FieldInfo:
 def get_all_fields_info(model: Type[Any], prefix: str = "") -> List[FieldInfo]:
     """Extract field information from model (recursive for nested dataclasses).
 
+    Results for a model class are computed once and cached; each call returns
+    a new list of the (immutable) cached FieldInfo objects.
+
     Args:
         model: Dataclass model to extract fields from
         prefix: Prefix for nested fields (e.g., "db" for db.host)
@@ -65,12 +107,32 @@ def get_all_fields_info(model: Type[Any], prefix: str = "") -> List[FieldInfo]:
     if not is_dataclass(model):
         return []
 
+    if prefix or not isinstance(model, type):
+        return _extract_fields_info(model, prefix)
+
+    cached = _FIELDS_INFO_CACHE.get(model)
+    if cached is None:
+        cached = tuple(_extract_fields_info(model))
+        _FIELDS_INFO_CACHE[model] = cached
+    return list(cached)
+
+
+def _extract_fields_info(model: Type[Any], prefix: str = "") -> List[FieldInfo]:
+    """Build FieldInfo objects for model without consulting the cache.
+
+    Args:
+        model: Dataclass model to extract fields from
+        prefix: Prefix for nested fields (e.g., "db" for db.host)
+
+    Returns:
+        List of FieldInfo objects for all fields (including nested)
+    """
     result: List[FieldInfo] = []
 
     for field in fields(model):
         # Normalize field name
         normalized_name = normalize_key(field.name)
-        normalized_key = f"{prefix}.{normalized_name}" if prefix else normalized_name
+        normalized_key = sys.intern(f"{prefix}.{normalized_name}") if prefix else normalized_name
 
         # Extract metadata
         metadata = field.metadata if hasattr(field, "metadata") else {}
@@ -79,32 +141,17 @@ def get_all_fields_info(model: Type[Any], prefix: str = "") -> List[FieldInfo]:
 
         # Get default and default_factory
         # Use ... as sentinel for missing values (consistent with dataclass behavior)
-        from dataclasses import _MISSING_TYPE
-
-        default = (
-            field.default
-            if field.default is not ... and not isinstance(field.default, _MISSING_TYPE)
-            else ...
-        )
-        default_factory = (
-            field.default_factory
-            if field.default_factory is not ...
-            and not isinstance(field.default_factory, _MISSING_TYPE)
-            else ...
-        )
+        default = field.default if field.default is not MISSING else ...
+        default_factory = field.default_factory if field.default_factory is not MISSING else ...
 
         # Determine required/optional based on type annotation and default value
         # 1. If type is Optional[T] → optional
         # 2. If has default or default_factory → optional
         # 3. Otherwise → required
-        from typing import Union, get_args, get_origin
-
-        is_optional_type = False
-        origin = get_origin(field.type)
-        if origin is Union:
-            args = get_args(field.type)
-            if type(None) in args:
-                is_optional_type = True
+        # Read field.type directly rather than typing.get_type_hints(): a Union
+        # check needs no forward-reference evaluation or MRO walk.
+        field_type = field.type
+        is_optional_type = get_origin(field_type) is Union and type(None) in get_args(field_type)
 
         has_default = default is not ... or default_factory is not ...
         optional = is_optional_type or has_default
@@ -126,20 +173,21 @@ def get_all_fields_info(model: Type[Any], prefix: str = "") -> List[FieldInfo]:
 
         # Recursively process nested dataclasses
         if is_dataclass(field.type):
-            nested_fields = get_all_fields_info(field.type, prefix=normalized_key)
+            nested_fields = _extract_fields_info(field.type, prefix=normalized_key)
             result.extend(nested_fields)
 
     return result
 
 
-def get_all_field_keys(model: Type[Any]) -> Set[str]:
+def get_all_field_keys(model: Type[Any]) -> AbstractSet[str]:
     """Extract all normalized field keys from model (recursive).
 
     Args:
         model: Dataclass model to extract keys from
 
     Returns:
-        Set of normalized keys (e.g., {"host", "db.host", "db.port"})
+        Frozen set of normalized keys (e.g., {"host", "db.host", "db.port"}),
+        cached per model class
 
     Example:
         >>> @dataclass
@@ -154,8 +202,58 @@ def get_all_field_keys(model: Type[Any]) -> Set[str]:
         >>> keys == {"api_key", "db.host", "db.port"}
         True
     """
-    field_infos = get_all_fields_info(model)
-    return {field_info.normalized_key for field_info in field_infos}
+    if not isinstance(model, type):
+        return frozenset(field_info.normalized_key for field_info in get_all_fields_info(model))
+
+    keys = _FIELD_KEYS_CACHE.get(model)
+    if keys is None:
+        keys = frozenset(field_info.normalized_key for field_info in get_all_fields_info(model))
+        _FIELD_KEYS_CACHE[model] = keys
+    return keys
+
+
+def get_raw_key_lookup(model: Type[Any]) -> Mapping[str, str]:
+    """Map lowercased raw keys (e.g., env var names) to normalized field keys.
+
+    For every normalized field key, all lowercase spellings that
+    :func:`~varlord.sources.base.normalize_key` turns into that key are
+    precomputed (each dot may come from ``__`` or a literal ``.``). Sources
+    can then resolve a raw key with ``lookup.get(raw_key.lower())`` instead
+    of normalizing every candidate key and testing membership.
+
+    Args:
+        model: Dataclass model to build the lookup for
+
+    Returns:
+        Mapping of lowercase raw key to normalized key, cached per model class
+
+    Example:
+        >>> lookup = get_raw_key_lookup(AppConfig)
+        >>> lookup["db__host"]
+        'db.host'
+        >>> lookup.get("unrelated_var") is None
+        True
+    """
+    if isinstance(model, type):
+        cached = _RAW_KEY_LOOKUP_CACHE.get(model)
+        if cached is not None:
+            return cached
+
+    lookup: Dict[str, str] = {}
+    for normalized_key in get_all_field_keys(model):
+        segments = normalized_key.split(".")
+        for separators in itertools.product((".", "__"), repeat=len(segments) - 1):
+            raw_key = segments[0] + "".join(
+                sep + segment for sep, segment in zip(separators, segments[1:])
+            )
+            # Underscores next to a separator can make "__" pair up differently,
+            # so only keep spellings that really normalize back to this key
+            if raw_key.replace("__", ".") == normalized_key:
+                lookup[raw_key] = normalized_key
+
+    if isinstance(model, type):
+        _RAW_KEY_LOOKUP_CACHE[model] = lookup
+    return lookup
 
 
 def get_field_info(model: Type[Any], field_name: str) -> Optional[FieldInfo]:
@@ -173,3 +271,69 @@ def get_field_info(model: Type[Any], field_name: str) -> Optional[FieldInfo]:
         if field_info.normalized_key == normalize_key(field_name):
             return field_info
     return None
+
+
+def _get_model_fields(model: Type[Any]) -> Dict[str, Field]:
+    """Return the (cached) mapping of field names to fields for ``model``.
+
+    The returned dict is shared and must not be mutated.
+    """
+    if not isinstance(model, type):
+        return {f.name: f for f in fields(model)}
+    model_fields = _MODEL_FIELDS_CACHE.get(model)
+    if model_fields is None:
+        model_fields = {f.name: f for f in fields(model)}
+        _MODEL_FIELDS_CACHE[model] = model_fields
+    return model_fields
+
+
+def _is_frozen_model(model: type) -> bool:
+    """Return True if model and every nested dataclass model are frozen."""
+    if not isinstance(model, type):
+        return False
+    frozen = _FROZEN_MODEL_CACHE.get(model)
+    if frozen is None:
+        # Conservative placeholder in case the model refers to itself
+        _FROZEN_MODEL_CACHE[model] = False
+        frozen = is_dataclass(model) and model.__dataclass_params__.frozen
+        if frozen:
+            for f in fields(model):
+                candidates = (f.type, *get_args(f.type))
+                if any(is_dataclass(t) and not _is_frozen_model(t) for t in candidates):
+                    frozen = False
+                    break
+        _FROZEN_MODEL_CACHE[model] = frozen
+    return frozen
+
+
+def _value_signature(value: Any) -> Any:
+    """Return a hashable signature of value that records exact types at every level.
+
+    Raises:
+        TypeError: If value is neither an immutable scalar nor an instance of a
+            frozen model whose field values are themselves signable.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_VALUE_TYPES:
+        # Include the type: 1, 1.0 and True compare equal but convert differently
+        return (value_type, value)
+    if not _is_frozen_model(value_type):
+        raise TypeError(f"unsupported value type: {value_type!r}")
+    return (
+        value_type,
+        tuple(
+            (name, _value_signature(getattr(value, name))) for name in _get_model_fields(value_type)
+        ),
+    )
+
+
+def _config_signature(config_dict: dict[str, Any]) -> Optional[frozenset]:
+    """Return a hashable, type-strict signature of config_dict.
+
+    Returns None if any value (at any nesting level) is neither an immutable
+    scalar nor an instance of a frozen model.
+    """
+    try:
+        return frozenset((key, _value_signature(value)) for key, value in config_dict.items())
+    except TypeError:
+        return None
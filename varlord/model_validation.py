@@ -10,11 +10,32 @@ For value validation (e.g., validate_port, validate_email), see varlord.validato
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Type, Union, get_args, get_origin
+import weakref
+from dataclasses import is_dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, get_args, get_origin
 
-from varlord.metadata import get_all_fields_info
+from varlord.metadata import FieldInfo, get_all_fields_info
 from varlord.sources.base import Source
 
+# Per-model required fields, as (field_info, is_nested_dataclass) pairs.
+_REQUIRED_FIELDS_CACHE: weakref.WeakKeyDictionary[type, Tuple[Tuple[FieldInfo, bool], ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_required_fields(model: Type[Any]) -> Tuple[Tuple[FieldInfo, bool], ...]:
+    """Return the required fields of model (cached per model class)."""
+    cached = _REQUIRED_FIELDS_CACHE.get(model) if isinstance(model, type) else None
+    if cached is None:
+        cached = tuple(
+            (field_info, is_dataclass(field_info.type))
+            for field_info in get_all_fields_info(model)
+            if field_info.required
+        )
+        if isinstance(model, type):
+            _REQUIRED_FIELDS_CACHE[model] = cached
+    return cached
+
 
 class VarlordError(Exception):
     """Base exception for varlord errors."""
@@ -108,8 +129,6 @@ class RequiredFieldError(VarlordError):
 
             # Check if child fields exist for nested dataclass fields
             if config_dict is not None and field_info:
-                from dataclasses import is_dataclass
-
                 if is_dataclass(field_info.type):
                     prefix = field_key + "."
                     child_fields = [k for k in config_dict.keys() if k.startswith(prefix)]
@@ -217,31 +236,24 @@ def validate_config(
     else:
         model_name = model.__name__
 
-    # Get all field info
-    field_infos = get_all_fields_info(model)
-
     # Find missing required fields
     missing_fields: List[str] = []
     missing_field_infos: List[Any] = []
-    for field_info in field_infos:
-        if field_info.required:
-            # Check if key exists in config_dict
-            if field_info.normalized_key in config_dict:
-                continue  # Field exists, skip
-
-            # For nested dataclass fields, check if any child field exists
-            from dataclasses import is_dataclass
-
-            if is_dataclass(field_info.type):
-                # Check if any child field exists
-                prefix = field_info.normalized_key + "."
-                has_child = any(key.startswith(prefix) for key in config_dict.keys())
-                if has_child:
-                    continue  # Parent field is satisfied by child fields
-
-            # Field is missing
-            missing_fields.append(field_info.normalized_key)
-            missing_field_infos.append(field_info)
+    for field_info, is_nested in _get_required_fields(model):
+        # Check if key exists in config_dict
+        if field_info.normalized_key in config_dict:
+            continue  # Field exists, skip
+
+        # For nested dataclass fields, check if any child field exists
+        if is_nested:
+            prefix = field_info.normalized_key + "."
+            has_child = any(key.startswith(prefix) for key in config_dict.keys())
+            if has_child:
+                continue  # Parent field is satisfied by child fields
+
+        # Field is missing
+        missing_fields.append(field_info.normalized_key)
+        missing_field_infos.append(field_info)
 
     # Raise error if any required fields are missing
     if missing_fields:
@@ -8,8 +8,8 @@ per-key priority rules.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern
 
 
 @dataclass
@@ -60,8 +60,36 @@ class PriorityPolicy:
     Keys are glob patterns (e.g., "secrets.*", "db.*").
     Values are priority lists for matching keys.
     Can contain source IDs or names (same as default).
+
+    Patterns are compiled when the policy is created; the first matching
+    pattern (in insertion order) wins.
     """
 
+    _override_matcher: Optional[Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _override_priorities: List[List[str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # key -> index into _override_priorities (-1 means "use default")
+    _priority_cache: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile override patterns into a single regex."""
+        if not self.overrides:
+            return
+        # One named group per pattern. Regex alternation tries alternatives in
+        # order, so the first matching pattern still wins.
+        alternatives = []
+        for index, (pattern, priority) in enumerate(self.overrides.items()):
+            # Convert glob pattern to regex
+            regex_pattern = pattern.replace(".", r"\.").replace("*", ".*")
+            alternatives.append(f"(?P<_p{index}>{regex_pattern})")
+            self._override_priorities.append(priority)
+        self._override_matcher = re.compile("|".join(alternatives))
+
     def get_priority(self, key: str) -> List[str]:
         """Get priority order for a specific key.
 
@@ -73,14 +101,15 @@ class PriorityPolicy:
             - Source ID (e.g., "yaml:/etc/config.yaml"): Exact match
             - Source name (e.g., "yaml"): Match all sources with this name
         """
-        if self.overrides:
-            for pattern, priority in self.overrides.items():
-                # Convert glob pattern to regex
-                regex_pattern = pattern.replace(".", r"\.").replace("*", ".*")
-                if re.match(regex_pattern, key):
-                    return priority
-
-        return self.default
+        if self._override_matcher is None:
+            return self.default
+
+        index = self._priority_cache.get(key)
+        if index is None:
+            match = self._override_matcher.match(key)
+            index = -1 if match is None else int(match.lastgroup[2:])
+            self._priority_cache[key] = index
+        return self.default if index < 0 else self._override_priorities[index]
 
     def __repr__(self) -> str:
         """Return string representation."""
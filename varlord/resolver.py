@@ -6,8 +6,10 @@ Handles merging configuration from multiple sources according to priority.
 
 from __future__ import annotations
 
+import logging
 from typing import Any, Dict, List, Mapping, Optional
 
+from varlord.logging import get_logger, log_merge, log_source_load
 from varlord.policy import PriorityPolicy
 from varlord.sources.base import Source
 
@@ -91,23 +93,26 @@ class Resolver:
         if self._policy:
             return self._resolve_with_policy()
 
+        # Per-key merge logging is only worth its cost when DEBUG is enabled
+        debug_merges = get_logger().isEnabledFor(logging.DEBUG)
+
         result: Dict[str, Any] = {}
         source_order = self._get_source_order(key)
 
         # Merge sources in priority order (later sources override earlier ones)
         for source in source_order:
             config = source.load()
-            try:
-                from varlord.logging import log_merge, log_source_load
-
-                log_source_load(source.name, len(config))
-                # Log individual merges in debug mode
+            log_source_load(source.name, len(config))
+            if debug_merges:
                 for k, v in config.items():
                     log_merge(source.name, k, v)
-            except ImportError:
-                pass  # Logging not available
 
-            self._deep_merge(result, config)
+            if result:
+                self._deep_merge(result, config)
+            else:
+                # Sources emit flat dotted keys, so the first non-empty layer
+                # has nothing to merge against and is taken in one C-level copy
+                result.update(config)
 
         return result
 
@@ -117,38 +122,61 @@ class Resolver:
         Returns:
             Merged configuration dictionary.
         """
-        # First, load all sources (use source.id as key)
-        all_configs: Dict[str, Dict[str, Any]] = {}
-        for source in self._sources:
-            all_configs[source.id] = source.load()
+        # First, load all sources (a source ID maps to the last source with that ID)
+        all_configs: List[Mapping[str, Any]] = [source.load() for source in self._sources]
+        id_to_index: Dict[str, int] = {source.id: i for i, source in enumerate(self._sources)}
 
         # Collect all keys from all sources
         all_keys: set[str] = set()
-        for config in all_configs.values():
+        for config in all_configs:
             all_keys.update(config.keys())
 
+        # Priority lists are shared by every key they apply to, so translate
+        # each distinct list into source indices once. Keyed by id(): the lists
+        # are owned by the policy and stay alive for the whole resolve.
+        plans: Dict[int, List[int]] = {}
+
         # Resolve each key according to its priority
         result: Dict[str, Any] = {}
         for key in all_keys:
             priority_names_or_ids = self._policy.get_priority(key)  # type: ignore
+            plan = plans.get(id(priority_names_or_ids))
+            if plan is None:
+                plan = self._build_merge_plan(priority_names_or_ids, id_to_index)
+                plans[id(priority_names_or_ids)] = plan
+
             # Merge sources in priority order for this key
             # Later sources in the list override earlier ones
-            for name_or_id in priority_names_or_ids:
-                # Check if it's an exact ID match
-                if name_or_id in all_configs:
-                    if key in all_configs[name_or_id]:
-                        result[key] = all_configs[name_or_id][key]
-                        # Don't break - continue to let later sources override
-                # Check if it's a name match (match all sources with this name)
-                elif name_or_id in self._name_to_sources:
-                    # Check all sources with this name, in order
-                    for source in self._name_to_sources[name_or_id]:
-                        if source.id in all_configs and key in all_configs[source.id]:
-                            result[key] = all_configs[source.id][key]
-                            # Don't break - continue to let later sources override
+            for index in plan:
+                config = all_configs[index]
+                if key in config:
+                    result[key] = config[key]
 
         return result
 
+    def _build_merge_plan(
+        self, priority_names_or_ids: List[str], id_to_index: Dict[str, int]
+    ) -> List[int]:
+        """Translate a priority list into indices of sources to merge, in order.
+
+        Args:
+            priority_names_or_ids: Source IDs (exact match) or names (all sources
+                of that type, in source order)
+            id_to_index: Source ID -> index of the source's loaded config
+
+        Returns:
+            Indices into the loaded configs, in merge order.
+        """
+        plan: List[int] = []
+        for name_or_id in priority_names_or_ids:
+            if name_or_id in id_to_index:
+                # Exact ID match
+                plan.append(id_to_index[name_or_id])
+            elif name_or_id in self._name_to_sources:
+                # Name match - all sources with this name, in order
+                plan.extend(id_to_index[source.id] for source in self._name_to_sources[name_or_id])
+        return plan
+
     def _deep_merge(self, base: Dict[str, Any], update: Mapping[str, Any]) -> None:
         """Deep merge update into base.
 
@@ -157,12 +185,16 @@ class Resolver:
             update: Dictionary to merge from
         """
         for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                self._deep_merge(base[key], value)
-            else:
-                # Overwrite with new value
-                base[key] = value
+            # Check the incoming value first: most values are scalars, so this
+            # avoids a lookup in base for the common case
+            if isinstance(value, dict):
+                existing = base.get(key)
+                if isinstance(existing, dict):
+                    # Recursively merge nested dictionaries
+                    self._deep_merge(existing, value)
+                    continue
+            # Overwrite with new value
+            base[key] = value
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -12,56 +12,60 @@ Provides various configuration sources:
 - Etcd: From etcd key-value store (optional, requires 'etcd' extra)
 
 Note: Optional sources require their respective extras to be installed.
+File and etcd sources are imported lazily, on first attribute access.
+``__all__`` lists every source class, including those whose backend is not
+installed; such sources still import, and raise ImportError naming the
+missing extra when instantiated (DotEnv reports a failed load instead).
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 from varlord.sources.base import ChangeEvent, Source
 from varlord.sources.cli import CLI
 from varlord.sources.defaults import Defaults
 from varlord.sources.env import Env
 
+# File and remote sources are imported on first attribute access so that
+# ``import varlord`` does not pay for PyYAML, python-dotenv, tomllib or etcd3
+# (and its gRPC stack) unless those sources are actually used.
+_LAZY_SOURCES = {
+    "JSON": "varlord.sources.json",
+    "DotEnv": "varlord.sources.dotenv",
+    "YAML": "varlord.sources.yaml",
+    "TOML": "varlord.sources.toml",
+    "Etcd": "varlord.sources.etcd",
+}
+
+# Every lazy source module imports without its optional backend (the backend
+# is checked when the source is used), so all of them are safe to export.
 __all__ = [
     "Source",
     "ChangeEvent",
     "Defaults",
     "Env",
     "CLI",
+    *_LAZY_SOURCES,
 ]
 
-# JSON source (standard library, always available)
-try:
-    from varlord.sources.json import JSON  # noqa: F401
-
-    __all__.append("JSON")
-except ImportError:
-    pass
-
-# Optional sources (require extras)
-try:
-    from varlord.sources.dotenv import DotEnv  # noqa: F401
-
-    __all__.append("DotEnv")
-except ImportError:
-    pass
-
-try:
-    from varlord.sources.yaml import YAML  # noqa: F401
-
-    __all__.append("YAML")
-except ImportError:
-    pass
-
-try:
-    from varlord.sources.toml import TOML  # noqa: F401
 
-    __all__.append("TOML")
-except ImportError:
-    pass
+def __getattr__(name: str) -> Any:
+    """Import optional sources lazily (PEP 562)."""
+    module_name = _LAZY_SOURCES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name)
+    except (ImportError, TypeError) as e:
+        # TypeError can occur if etcd3 is installed but protobuf version is incompatible
+        # In this case, treat the source as unavailable
+        raise AttributeError(f"Source {name!r} is not available: {e}") from e
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-try:
-    from varlord.sources.etcd import Etcd  # noqa: F401
 
-    __all__.append("Etcd")
-except (ImportError, TypeError):
-    # TypeError can occur if etcd3 is installed but protobuf version is incompatible
-    # In this case, treat etcd as unavailable
-    pass
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_SOURCES))
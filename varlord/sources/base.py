@@ -6,10 +6,13 @@ Defines the interface that all configuration sources must implement.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterator, Mapping, Optional, Type
 
 
+@lru_cache(maxsize=4096)
 def normalize_key(key: str) -> str:
     """Unified key normalization function.
 
@@ -18,6 +21,8 @@ def normalize_key(key: str) -> str:
     - Single underscores (_) are preserved (only case is converted)
     - Keys are converted to lowercase
 
+    Results are memoized: the same keys are normalized on every load.
+
     Args:
         key: The key to normalize
 
@@ -26,7 +31,7 @@ def normalize_key(key: str) -> str:
 
     Examples::
         >>> normalize_key("APP_DB__HOST")
-        'app.db.host'
+        'app_db.host'
         >>> normalize_key("K8S_POD_NAME")
         'k8s_pod_name'
         >>> normalize_key("db__host")
@@ -41,14 +46,10 @@ def normalize_key(key: str) -> str:
     if not key:
         return ""
 
-    # Convert to lowercase
-    key = key.lower()
-
-    # Replace double underscores with dots (for nesting)
-    # This handles all cases: __, ___, ____, etc.
-    key = key.replace("__", ".")
-
-    return key
+    # Lowercase, then replace double underscores with dots (for nesting).
+    # This handles all cases: __, ___, ____, etc. Interned so keys from every
+    # source share one object with the model's field keys (see metadata).
+    return sys.intern(key.lower().replace("__", "."))
 
 
 @dataclass(frozen=True)
@@ -79,6 +80,9 @@ class Source:
     - watch() -> Iterator[ChangeEvent]: Stream of changes for dynamic updates
     """
 
+    # Subclasses that do not declare __slots__ still get a per-instance __dict__
+    __slots__ = ("_model", "_source_id", "_load_status", "_load_error", "__weakref__")
+
     def __init__(
         self,
         model: Optional[Type[Any]] = None,
@@ -176,8 +180,10 @@ class Source:
         """Load configuration from this source.
 
         Returns:
-            A mapping of configuration key-value pairs.
+            A flat mapping of configuration key-value pairs.
             Keys should be normalized (e.g., "db.host" for nested configs).
+            Nested dataclass fields must be emitted as dotted keys, not as
+            nested dicts; dict values are reserved for dict-typed fields.
         """
         raise NotImplementedError("Subclasses must implement load()")
 
@@ -8,12 +8,33 @@ Only parses arguments for fields defined in the model.
 from __future__ import annotations
 
 import argparse
+import copy
 import sys
-from typing import Any, List, Mapping, Optional, Type
+import weakref
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
 
-from varlord.metadata import get_all_field_keys, get_all_fields_info
+from varlord.metadata import get_all_fields_info
 from varlord.sources.base import Source
 
+# Parsers are built once per model class and reused by every CLI source and
+# every load(); argparse parsers are not modified by parse_known_args().
+_PARSER_CACHE: weakref.WeakKeyDictionary[
+    type, Tuple[argparse.ArgumentParser, Tuple[Tuple[str, str], ...]]
+] = weakref.WeakKeyDictionary()
+
+# Parsed results per model class, keyed by the argv tuple. Parsing is a pure
+# function of (parser, argv), so repeated loads of the same command line (e.g.
+# several Config objects in one process) skip argparse entirely. Bounded per
+# model so tests that vary argv cannot grow it without limit.
+_PARSE_CACHE: weakref.WeakKeyDictionary[type, Dict[Tuple[str, ...], Dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+_PARSE_CACHE_MAX_ENTRIES = 32
+
+# Every option string a model's parser may accept, per model class. Lets
+# _parse_argv() skip argparse when argv cannot match any model field.
+_OPTION_STRINGS_CACHE: weakref.WeakKeyDictionary[type, frozenset] = weakref.WeakKeyDictionary()
+
 
 def normalized_key_to_cli_arg(normalized_key: str) -> str:
     """Convert normalized key to CLI argument format.
@@ -53,6 +74,161 @@ def cli_arg_to_normalized_key(cli_arg: str) -> str:
     return ".".join(normalized_parts)
 
 
+def _make_type_converter(field_type: Any) -> Any:
+    """Create an argparse type callable that falls back to the raw string."""
+
+    def converter(value):
+        try:
+            return field_type(value)
+        except (ValueError, TypeError):
+            return value
+
+    return converter
+
+
+def _build_parser(
+    model: Type[Any],
+) -> Tuple[argparse.ArgumentParser, Tuple[Tuple[str, str], ...]]:
+    """Build an argument parser for all fields of model.
+
+    Args:
+        model: Dataclass model to build arguments for
+
+    Returns:
+        Tuple of (parser, ((normalized_key, argparse_dest), ...))
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False, add_help=False)
+    dests: List[Tuple[str, str]] = []
+
+    for field_info in get_all_fields_info(model):
+        normalized_key = field_info.normalized_key
+        field_type = field_info.type
+
+        cli_arg_name = normalized_key_to_cli_arg(normalized_key)
+        argparse_dest = normalized_key.replace(".", "_")
+
+        try:
+            if field_type is bool:
+                parser.add_argument(
+                    f"--{cli_arg_name}",
+                    action="store_true",
+                    default=None,
+                    dest=argparse_dest,
+                    required=False,
+                )
+                parser.add_argument(
+                    f"--no-{cli_arg_name}",
+                    dest=argparse_dest,
+                    action="store_false",
+                    default=None,
+                )
+            else:
+                parser.add_argument(
+                    f"--{cli_arg_name}",
+                    type=_make_type_converter(field_type),
+                    default=None,
+                    dest=argparse_dest,
+                    required=False,
+                )
+        except Exception as e:
+            import logging
+
+            logging.debug(f"Failed to add argument for {normalized_key}: {e}")
+            continue
+
+        dests.append((normalized_key, argparse_dest))
+
+    return parser, tuple(dests)
+
+
+def _get_parser(
+    model: Type[Any],
+) -> Tuple[argparse.ArgumentParser, Tuple[Tuple[str, str], ...]]:
+    """Return the cached argument parser for model, building it on first use."""
+    if not isinstance(model, type):
+        return _build_parser(model)
+
+    cached = _PARSER_CACHE.get(model)
+    if cached is None:
+        cached = _build_parser(model)
+        _PARSER_CACHE[model] = cached
+    return cached
+
+
+def _build_option_strings(model: Type[Any]) -> frozenset:
+    """Collect the option strings (``--host``, ``--no-debug``) for model's fields."""
+    options = set()
+    for field_info in get_all_fields_info(model):
+        cli_arg_name = normalized_key_to_cli_arg(field_info.normalized_key)
+        options.add(f"--{cli_arg_name}")
+        if field_info.type is bool:
+            options.add(f"--no-{cli_arg_name}")
+    return frozenset(options)
+
+
+def _mentions_model_option(model: Type[Any], argv: Tuple[str, ...]) -> bool:
+    """Return whether any argv token could be parsed as one of model's options.
+
+    Accepts both ``--flag value`` and ``--flag=value`` forms. Abbreviations are
+    disabled on the parser, so an exact match is the only way to match.
+    """
+    if isinstance(model, type):
+        options = _OPTION_STRINGS_CACHE.get(model)
+        if options is None:
+            options = _OPTION_STRINGS_CACHE[model] = _build_option_strings(model)
+    else:
+        options = _build_option_strings(model)
+
+    for arg in argv:
+        if arg.startswith("--") and (arg in options or arg.partition("=")[0] in options):
+            return True
+    return False
+
+
+def _parse_argv(model: Type[Any], argv: Tuple[str, ...]) -> Dict[str, Any]:
+    """Parse argv against model's parser, reusing a cached result if available.
+
+    Args:
+        model: Dataclass model the arguments belong to
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Mapping of normalized keys to parsed values. May be shared; do not mutate.
+    """
+    cache = None
+    if isinstance(model, type):
+        cache = _PARSE_CACHE.get(model)
+        if cache is None:
+            cache = _PARSE_CACHE[model] = {}
+        cached = cache.get(argv)
+        if cached is not None:
+            return cached
+
+    if not _mentions_model_option(model, argv):
+        # Nothing argparse could match: skip building the namespace entirely
+        return {}
+
+    parser, dests = _get_parser(model)
+    filtered_argv = [arg for arg in argv if arg not in ("--help", "-h")]
+
+    result: Dict[str, Any] = {}
+    try:
+        args, _ = parser.parse_known_args(filtered_argv)
+    except SystemExit:
+        pass
+    else:
+        for normalized_key, argparse_dest in dests:
+            value = getattr(args, argparse_dest, None)
+            if value is not None:
+                result[normalized_key] = value
+
+    if cache is not None:
+        if len(cache) >= _PARSE_CACHE_MAX_ENTRIES:
+            cache.clear()
+        cache[argv] = result
+    return result
+
+
 class CLI(Source):
     """Source that loads configuration from command-line arguments.
 
@@ -138,86 +314,29 @@ class CLI(Source):
                     "When used independently, provide model explicitly: CLI(model=AppConfig)"
                 )
 
-            valid_keys = get_all_field_keys(self._model)
-            field_info_map = {
-                info.normalized_key: info for info in get_all_fields_info(self._model)
-            }
-
-            parser = argparse.ArgumentParser(allow_abbrev=False, add_help=False)
-
-            for normalized_key in valid_keys:
-                if normalized_key not in field_info_map:
-                    continue
-
-                field_info = field_info_map[normalized_key]
-                field_type = field_info.type
-
-                cli_arg_name = normalized_key_to_cli_arg(normalized_key)
-                argparse_dest = normalized_key.replace(".", "_")
-
-                try:
-                    if field_type is bool:
-                        parser.add_argument(
-                            f"--{cli_arg_name}",
-                            action="store_true",
-                            default=None,
-                            dest=argparse_dest,
-                            required=False,
-                        )
-                        parser.add_argument(
-                            f"--no-{cli_arg_name}",
-                            dest=argparse_dest,
-                            action="store_false",
-                            default=None,
-                        )
-                    else:
-
-                        def make_type_converter(ftype):
-                            def converter(value):
-                                try:
-                                    return ftype(value)
-                                except (ValueError, TypeError):
-                                    return value
-
-                            return converter
-
-                        parser.add_argument(
-                            f"--{cli_arg_name}",
-                            type=make_type_converter(field_type),
-                            default=None,
-                            dest=argparse_dest,
-                            required=False,
-                        )
-                except Exception as e:
-                    import logging
-
-                    logging.debug(f"Failed to add argument for {normalized_key}: {e}")
-
-            argv = self._argv if self._argv is not None else sys.argv[1:]
-            filtered_argv = [arg for arg in argv if arg not in ("--help", "-h")]
-
-            try:
-                args, _ = parser.parse_known_args(filtered_argv)
-            except SystemExit:
-                self._load_status = "success"
-                return {}
-
-            result = {}
-            for normalized_key in valid_keys:
-                if normalized_key not in field_info_map:
-                    continue
-                argparse_dest = normalized_key.replace(".", "_")
-                value = getattr(args, argparse_dest, None)
-                if value is not None:
-                    result[normalized_key] = value
+            argv = tuple(self._argv if self._argv is not None else sys.argv[1:])
+            result = _parse_argv(self._model, argv)
 
             self._load_status = "success"
-            return result
+            # Copy (including container values) so callers can never mutate
+            # the cached result
+            return {
+                k: copy.deepcopy(v) if isinstance(v, (list, dict)) else v for k, v in result.items()
+            }
         except Exception as e:
             self._load_status = "failed"
             self._load_error = str(e)
             raise
 
+    @staticmethod
+    def invalidate() -> None:
+        """Drop all memoized command-line parse results.
+
+        Results are keyed by the exact argv, so changing ``sys.argv`` never
+        returns stale values; call this only to release the cached results.
+        """
+        _PARSE_CACHE.clear()
+
     def format_help(self, prog: Optional[str] = None) -> str:
         """Generate help text for all CLI arguments based on model fields.
 
@@ -7,12 +7,64 @@ This is now an internal source used automatically by Config.
 
 from __future__ import annotations
 
+import weakref
 from dataclasses import is_dataclass
-from typing import Any, Mapping, Optional, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
 
 from varlord.metadata import get_all_fields_info
 from varlord.sources.base import Source
 
+# Per-model defaults plan: (static defaults, ((key, default_factory), ...)).
+# Static defaults are resolved once; factories still run on every load so
+# each load gets fresh mutable defaults.
+_DefaultsPlan = Tuple[Dict[str, Any], Tuple[Tuple[str, Callable[[], Any]], ...]]
+_DEFAULTS_PLAN_CACHE: weakref.WeakKeyDictionary[type, _DefaultsPlan] = weakref.WeakKeyDictionary()
+
+
+def _build_defaults_plan(model: Type[Any]) -> _DefaultsPlan:
+    """Split model defaults into static values and default factories."""
+    static: Dict[str, Any] = {}
+    factories = []
+    for field_info in get_all_fields_info(model):
+        if field_info.default is not ...:
+            static[field_info.normalized_key] = field_info.default
+        elif field_info.default_factory is not ...:
+            # Placeholder keeps the key in field order; filled in per load
+            static[field_info.normalized_key] = None
+            factories.append((field_info.normalized_key, field_info.default_factory))
+    return static, tuple(factories)
+
+
+def _get_defaults_plan(model: Type[Any]) -> _DefaultsPlan:
+    """Return the defaults plan for a model, cached per model class."""
+    if not isinstance(model, type):
+        return _build_defaults_plan(model)
+    plan = _DEFAULTS_PLAN_CACHE.get(model)
+    if plan is None:
+        plan = _DEFAULTS_PLAN_CACHE[model] = _build_defaults_plan(model)
+    return plan
+
+
+def extract_defaults(model: Type[Any]) -> Dict[str, Any]:
+    """Extract default values from model (recursive, returns flat dict).
+
+    Args:
+        model: Dataclass model to extract defaults from
+
+    Returns:
+        Flat dictionary with normalized keys (e.g., {"host": "localhost", "db.host": "127.0.0.1"}).
+        Fields without defaults, or whose default_factory raises, are excluded.
+    """
+    static, factories = _get_defaults_plan(model)
+    result = dict(static)
+    for key, factory in factories:
+        try:
+            result[key] = factory()
+        except Exception:
+            del result[key]  # Skip if factory fails
+    return result
+
 
 class Defaults(Source):
     """Source that loads default values from a dataclass model.
@@ -31,6 +83,8 @@ class Defaults(Source):
         {'host': 'localhost', 'port': 8000}
     """
 
+    __slots__ = ("_precomputed_defaults",)
+
     def __init__(
         self,
         model: Type[Any],
@@ -69,30 +123,24 @@ class Defaults(Source):
             A mapping of normalized keys to their default values.
             Fields without defaults are excluded.
             Supports nested fields (e.g., {"db.host": "localhost"}).
+            The mapping is read-only when the model has no default factories.
         """
         # Reset status
         self._load_status = "unknown"
         self._load_error = None
 
         try:
-            # Use precomputed defaults if available
+            # Without factories every value is shared and immutable, so hand
+            # out a read-only view instead of copying the defaults each load
+            result: Mapping[str, Any]
             if self._precomputed_defaults is not None:
-                result = self._precomputed_defaults.copy()
+                result = MappingProxyType(self._precomputed_defaults)
             else:
-                # Extract defaults from model
-                result: dict[str, Any] = {}
-                field_infos = get_all_fields_info(self._model)
-
-                for field_info in field_infos:
-                    # Check for default value
-                    if field_info.default is not ...:
-                        result[field_info.normalized_key] = field_info.default
-                    # Check for default_factory
-                    elif field_info.default_factory is not ...:
-                        try:
-                            result[field_info.normalized_key] = field_info.default_factory()
-                        except Exception:
-                            pass  # Skip if factory fails
+                static, factories = _get_defaults_plan(self._model)
+                if factories:
+                    result = extract_defaults(self._model)
+                else:
+                    result = MappingProxyType(static)
 
             self._load_status = "success"
             return result
@@ -7,15 +7,22 @@ Only loads variables that map to fields defined in the model.
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional, Type
+import os
+import stat
+from typing import Any, Dict, Mapping, Optional, Type
 
 try:
     from dotenv import dotenv_values
 except ImportError:
     dotenv_values = None  # type: ignore
 
-from varlord.metadata import get_all_field_keys
-from varlord.sources.base import Source, normalize_key
+from varlord.metadata import get_raw_key_lookup
+from varlord.sources.base import Source
+from varlord.sources.file_base import _StatCache
+
+# Parsed .env files keyed by (absolute path, encoding), so unchanged files are
+# not re-read (see _StatCache for validation and bounds).
+_PARSED_DOTENV_CACHE: _StatCache[Dict[str, Optional[str]]] = _StatCache(max_entries=64)
 
 
 class DotEnv(Source):
@@ -100,25 +107,27 @@ class DotEnv(Source):
                 self._load_error = "python-dotenv not installed"
                 return {}
 
-            # Check if file exists
-            import os
-
-            if not os.path.exists(self._dotenv_path) or not os.path.isfile(self._dotenv_path):
+            # Check if file exists (a single stat, reused for cache validation)
+            try:
+                st = os.stat(self._dotenv_path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 self._load_status = "not_found"
                 self._load_error = None  # File not found is normal
                 return {}
 
-            # Load all variables from .env file
-            raw_values = dotenv_values(self._dotenv_path, encoding=self._encoding) or {}
+            # Load all variables from .env file (cached while the file is unchanged)
+            raw_values = self._load_raw_values(st)
 
-            # Get all valid field keys from model
-            valid_keys = get_all_field_keys(self._model)
+            # Lowercased variable name -> normalized model key (cached per model)
+            key_lookup = get_raw_key_lookup(self._model)
 
             # Filter by model fields
             result = {}
             for env_key, env_value in raw_values.items():
-                normalized_key = normalize_key(env_key)
-                if normalized_key in valid_keys:
+                normalized_key = key_lookup.get(env_key.lower())
+                if normalized_key is not None:
                     result[normalized_key] = env_value
 
             self._load_status = "success"
@@ -134,6 +143,22 @@ class DotEnv(Source):
                 raise
             return {}
 
+    def _load_raw_values(self, st: os.stat_result) -> Dict[str, Optional[str]]:
+        """Return the parsed .env file, reusing a cached parse if unchanged.
+
+        Args:
+            st: Result of ``os.stat`` on the file
+
+        Returns:
+            Raw variables from the file. Shared with the cache; do not mutate.
+        """
+        cache_key = (os.path.abspath(self._dotenv_path), self._encoding)
+        raw_values = _PARSED_DOTENV_CACHE.get(cache_key, st)
+        if raw_values is None:
+            raw_values = dotenv_values(self._dotenv_path, encoding=self._encoding) or {}
+            _PARSED_DOTENV_CACHE.put(cache_key, st, raw_values)
+        return raw_values
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<DotEnv(path={self._dotenv_path!r})>"
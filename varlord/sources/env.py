@@ -9,8 +9,8 @@ from __future__ import annotations
 import os
 from typing import Any, Mapping, Optional, Type
 
-from varlord.metadata import get_all_field_keys
-from varlord.sources.base import Source, normalize_key
+from varlord.metadata import get_raw_key_lookup
+from varlord.sources.base import Source
 
 
 class Env(Source):
@@ -29,6 +29,8 @@ class Env(Source):
         {'api_key': 'value1'}  # OTHER_VAR is ignored
     """
 
+    __slots__ = ("_prefix",)
+
     def __init__(
         self,
         model: Optional[Type[Any]] = None,
@@ -88,25 +90,30 @@ class Env(Source):
                     "When used independently, provide model explicitly: Env(model=AppConfig)"
                 )
 
-            # Get all valid field keys from model
-            valid_keys = get_all_field_keys(self._model)
+            # Lowercased variable name -> normalized model key (cached per model)
+            key_lookup = get_raw_key_lookup(self._model)
+
+            # Single pass over os.environ: filter by prefix and map names to
+            # model keys without building an intermediate copy
+            prefix = self._prefix
+            if prefix:
+                # Compare in uppercase for case-insensitive matching and strip the
+                # prefix (preserve original case for normalization)
+                prefix_len = len(prefix)
+                candidates = (
+                    (env_key[prefix_len:], env_value)
+                    for env_key, env_value in os.environ.items()
+                    if env_key[:prefix_len].upper() == prefix
+                )
+            else:
+                candidates = os.environ.items()
 
+            lookup = key_lookup.get
             result: dict[str, Any] = {}
-            for env_key, env_value in os.environ.items():
-                # Check prefix if specified (case-insensitive)
-                if self._prefix:
-                    # Compare in uppercase for case-insensitive matching
-                    if not env_key.upper().startswith(self._prefix):
-                        continue
-                    # Remove prefix (preserve original case for normalization)
-                    key_without_prefix = env_key[len(self._prefix) :]
-                    normalized_key = normalize_key(key_without_prefix)
-                else:
-                    # Normalize env var name (no prefix filtering)
-                    normalized_key = normalize_key(env_key)
-
-                # Only load if it matches a model field
-                if normalized_key in valid_keys:
+            for env_key, env_value in candidates:
+                # Only load if it maps to a model field
+                normalized_key = lookup(env_key.lower())
+                if normalized_key is not None:
                     result[normalized_key] = env_value
 
             self._load_status = "success"
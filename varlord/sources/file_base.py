@@ -10,11 +10,70 @@ Provides common functionality:
 
 from __future__ import annotations
 
+import copy
 import os
-from typing import Any, Mapping, Optional, Type
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Mapping, Optional, Tuple, Type, TypeVar
 
 from varlord.metadata import get_all_field_keys
-from varlord.sources.base import Source
+from varlord.sources.base import Source, normalize_key
+
+_FileSignature = Tuple[int, int, int]  # (st_mtime_ns, st_size, st_ino)
+_T = TypeVar("_T")
+
+# Files modified less than this long ago are not cached: a rewrite within the
+# filesystem's timestamp granularity could leave mtime and size unchanged.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+class _StatCache(Generic[_T]):
+    """Bounded LRU cache of parsed file contents validated by stat signature.
+
+    An entry is returned only while the file's (st_mtime_ns, st_size, st_ino)
+    is unchanged. Files modified within ``_RACY_MTIME_WINDOW_NS`` are never
+    stored, and the least recently used entry is evicted once ``max_entries``
+    files are cached, so processes that load many paths stay bounded.
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Tuple[_FileSignature, _T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, st: os.stat_result) -> Optional[_T]:
+        """Return the cached value for key if the file is unchanged, else None."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or cached[0] != (st.st_mtime_ns, st.st_size, st.st_ino):
+                return None
+            self._entries.move_to_end(key)
+            return cached[1]
+
+    def put(self, key: Hashable, st: os.stat_result, value: _T) -> None:
+        """Cache value for key, unless the file was modified too recently."""
+        if time.time_ns() - st.st_mtime_ns <= _RACY_MTIME_WINDOW_NS:
+            return
+        with self._lock:
+            self._entries[key] = ((st.st_mtime_ns, st.st_size, st.st_ino), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Parsed and flattened file contents keyed by (source class, path), so
+# repeated loads of an unchanged file skip reading and parsing it.
+_PARSED_FILE_CACHE: _StatCache[Dict[str, Any]] = _StatCache(max_entries=64)
 
 
 class FileSource(Source):
@@ -69,14 +128,6 @@ class FileSource(Source):
         path = os.path.abspath(path)
         return path
 
-    def _file_exists(self) -> bool:
-        """Check if file exists.
-
-        Returns:
-            True if file exists, False otherwise
-        """
-        return os.path.exists(self._file_path) and os.path.isfile(self._file_path)
-
     def _load_file_content(self) -> Any:
         """Load and parse file content.
 
@@ -107,8 +158,12 @@ class FileSource(Source):
         self._load_error = None
 
         try:
-            # Check file existence
-            if not self._file_exists():
+            # Check file existence (a single stat, reused for cache validation)
+            try:
+                st = os.stat(self._file_path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 if self._required:
                     raise FileNotFoundError(f"Required file not found: {self._file_path}")
                 # 文件不存在是正常情况（如本地没有 .env 文件），不记录为错误
@@ -116,16 +171,17 @@ class FileSource(Source):
                 self._load_error = None  # 不记录错误信息，因为这是正常情况
                 return {}
 
-            # Load and parse file
-            content = self._load_file_content()
-
-            # Convert nested structure to flat dot notation
-            flat_dict = self._flatten_dict(content)
+            # Load, parse and flatten file (cached while the file is unchanged)
+            flat_dict = self._load_flat_content(st)
 
-            # Filter by model if provided
-            if self._model:
-                valid_keys = get_all_field_keys(self._model)
-                flat_dict = {k: v for k, v in flat_dict.items() if k in valid_keys}
+            # Filter by model if provided; copy container values so callers
+            # can never mutate the cached content
+            valid_keys = get_all_field_keys(self._model) if self._model else None
+            flat_dict = {
+                k: copy.deepcopy(v) if isinstance(v, (list, dict)) else v
+                for k, v in flat_dict.items()
+                if valid_keys is None or k in valid_keys
+            }
 
             self._load_status = "success"
             return flat_dict
@@ -145,6 +201,22 @@ class FileSource(Source):
                 raise
             return {}
 
+    def _load_flat_content(self, st: os.stat_result) -> Dict[str, Any]:
+        """Return the flattened file content, reusing a cached parse if unchanged.
+
+        Args:
+            st: Result of ``os.stat`` on the file
+
+        Returns:
+            Flattened content. Shared with the cache; do not mutate.
+        """
+        cache_key = (type(self), self._file_path)
+        flat_dict = _PARSED_FILE_CACHE.get(cache_key, st)
+        if flat_dict is None:
+            flat_dict = self._flatten_dict(self._load_file_content())
+            _PARSED_FILE_CACHE.put(cache_key, st, flat_dict)
+        return flat_dict
+
     def _flatten_dict(self, d: dict, parent_key: str = "", sep: str = ".") -> dict:
         """Flatten nested dictionary to dot notation.
 
@@ -164,8 +236,6 @@ class FileSource(Source):
         items = []
         for k, v in d.items():
             # Normalize key name using normalize_key function
-            from varlord.sources.base import normalize_key
-
             normalized_k = normalize_key(str(k))
 
             new_key = f"{parent_key}{sep}{normalized_k}" if parent_key else normalized_k
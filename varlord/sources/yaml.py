@@ -74,5 +74,7 @@ class YAML(FileSource):
             FileNotFoundError: If file not found
             yaml.YAMLError: If YAML is invalid
         """
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(self._file_path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=loader) or {}
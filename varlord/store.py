@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass, is_dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from typing import Any, Callable, Dict, Iterator, Optional, Type
 
+from varlord.converters import get_converter
+from varlord.metadata import _config_signature, _get_model_fields, _is_frozen_model
 from varlord.resolver import Resolver
 from varlord.sources.base import ChangeEvent
 
@@ -39,23 +41,30 @@ class ConfigStore:
         self,
         resolver: Resolver,
         model: Type[Any],
+        reuse_instances: bool = False,
     ):
         """Initialize ConfigStore.
 
         Args:
             resolver: Resolver for merging sources
             model: Dataclass model for type conversion and validation
+            reuse_instances: Keep the current instance on reload when a frozen
+                model's merged values are unchanged (default: False). The model's
+                __post_init__ is then not rerun.
 
         Note:
             Watch is automatically enabled if any source supports it.
         """
         self._resolver = resolver
         self._model = model
+        self._reuse_instances = reuse_instances
 
         # Thread-safe storage
         self._lock = threading.RLock()
         self._config: Optional[Any] = None
         self._config_dict: Dict[str, Any] = {}
+        # Signature of self._config_dict when the model is frozen (else None)
+        self._signature: Optional[frozenset] = None
 
         # Subscribers
         self._subscribers: list[Callable[[Any, ConfigDiff], None]] = []
@@ -72,12 +81,30 @@ class ConfigStore:
             self._start_watching()
 
     def _reload(self) -> None:
-        """Reload configuration from all sources."""
+        """Reload configuration from all sources.
+
+        With reuse_instances=True, if the model and all nested models are
+        frozen dataclasses and the merged values are identical to the current
+        ones, the current instance is kept and subscribers are not notified.
+        """
         with self._lock:
             try:
                 # Resolve configuration
                 config_dict = self._resolver.resolve()
 
+                # Nothing changed: skip rebuilding an equal (immutable) model
+                signature = (
+                    _config_signature(config_dict)
+                    if self._reuse_instances and _is_frozen_model(self._model)
+                    else None
+                )
+                if (
+                    signature is not None
+                    and self._config is not None
+                    and signature == self._signature
+                ):
+                    return
+
                 # Convert to model instance
                 new_config = self._dict_to_model(config_dict)
 
@@ -90,6 +117,7 @@ class ConfigStore:
                 # Atomically replace
                 self._config = new_config
                 self._config_dict = config_dict
+                self._signature = signature
 
                 # Notify subscribers
                 if diff.added or diff.modified or diff.deleted:
@@ -142,111 +170,40 @@ class ConfigStore:
         Returns:
             Nested dictionary matching the model structure
         """
-        from dataclasses import asdict, fields
-
-        from varlord.converters import convert_value
-
-        field_info = {f.name: f for f in fields(model)}
+        field_info = _get_model_fields(model)
         result: Dict[str, Any] = {}
 
-        # Step 1: Convert all dataclass instances in flat_dict to dicts
-        flat_dict_processed = {}
+        # Single pass: plain fields are converted directly, while everything
+        # belonging to a nested dataclass field is grouped under its parent
+        nested: Dict[str, Dict[str, Any]] = {}
         for key, value in flat_dict.items():
             if is_dataclass(type(value)):
-                flat_dict_processed[key] = asdict(value)
-            else:
-                flat_dict_processed[key] = value
-
-        # Step 2: Process flat keys first (non-nested)
-        for key, value in flat_dict_processed.items():
-            if "." not in key:
-                if key in field_info:
-                    field = field_info[key]
-                    try:
-                        converted_value = convert_value(value, field.type, key=key)
-                        result[key] = converted_value
-                    except (ValueError, TypeError):
-                        result[key] = value
-
-        # Step 3: Process nested keys
-        for key, value in flat_dict_processed.items():
-            if "." in key:
-                parts = key.split(".", 1)
-                parent_key = parts[0]
-                child_key = parts[1]
-
-                if parent_key in field_info:
-                    field = field_info[parent_key]
-                    if is_dataclass(field.type):
-                        # Initialize parent dict if needed
-                        if parent_key not in result:
-                            # Use value from flat_dict_processed if available
-                            if parent_key in flat_dict_processed:
-                                parent_value = flat_dict_processed[parent_key]
-                                if isinstance(parent_value, dict):
-                                    result[parent_key] = parent_value.copy()
-                                else:
-                                    result[parent_key] = {}
-                            else:
-                                result[parent_key] = {}
-                        elif not isinstance(result[parent_key], dict):
-                            result[parent_key] = {}
-
-                        # Recursively process nested structure
-                        # First, get existing nested values to preserve them
-                        existing_nested = {}
-                        if parent_key in result and isinstance(result[parent_key], dict):
-                            for k, v in result[parent_key].items():
-                                if is_dataclass(type(v)):
-                                    existing_nested[k] = asdict(v)
-                                elif isinstance(v, dict):
-                                    existing_nested[k] = v.copy()
-                                else:
-                                    existing_nested[k] = v
-
-                        # Merge existing values with the new nested key
-                        nested_flat = {child_key: value}
-                        if existing_nested:
-                            # Merge existing nested values into nested_flat for recursive processing
-                            for k, v in existing_nested.items():
-                                if k not in nested_flat:
-                                    nested_flat[k] = v
-
-                        nested_result = self._flatten_to_nested(nested_flat, field.type)
-
-                        # Update result[parent_key] with nested_result (all values are now in nested_result)
-                        for nested_key, nested_value in nested_result.items():
-                            if is_dataclass(type(nested_value)):
-                                result[parent_key][nested_key] = asdict(nested_value)
-                            else:
-                                result[parent_key][nested_key] = nested_value
-
-        # Step 4: Convert nested dicts to dataclass instances with type conversion
-        for key, value in list(result.items()):
-            if key in field_info:
-                field = field_info[key]
-                if is_dataclass(field.type) and isinstance(value, dict):
-                    # First, convert any dataclass instances in value to dicts
-                    value_dict = {}
-                    for nested_key, nested_value in value.items():
-                        if is_dataclass(type(nested_value)):
-                            value_dict[nested_key] = asdict(nested_value)
-                        else:
-                            value_dict[nested_key] = nested_value
-                    # Recursively process and convert types
-                    nested_instance = self._flatten_to_nested(value_dict, field.type)
-                    # Convert all values to correct types
-                    nested_fields = {f.name: f for f in fields(field.type)}
-                    for nested_key, nested_value in nested_instance.items():
-                        if nested_key in nested_fields:
-                            nested_field = nested_fields[nested_key]
-                            try:
-                                nested_instance[nested_key] = convert_value(
-                                    nested_value, nested_field.type, key=f"{key}.{nested_key}"
-                                )
-                            except (ValueError, TypeError):
-                                pass
-                    result[key] = field.type(**nested_instance)
+                value = asdict(value)
+
+            parent_key, dot, child_key = key.partition(".")
+            field = field_info.get(parent_key)
+            if field is None:
+                continue
+
+            if dot:
+                if is_dataclass(field.type):
+                    nested.setdefault(parent_key, {})[child_key] = value
+                continue
+
+            if is_dataclass(field.type) and isinstance(value, dict):
+                # Whole-object value; dotted child keys take precedence over it
+                nested[parent_key] = {**value, **nested.get(parent_key, {})}
+                continue
+
+            try:
+                result[key] = get_converter(field.type)(value, key=key)
+            except (ValueError, TypeError):
+                result[key] = value
+
+        # Build each nested dataclass once from its complete child dict
+        for parent_key, child_dict in nested.items():
+            nested_type = field_info[parent_key].type
+            result[parent_key] = nested_type(**self._flatten_to_nested(child_dict, nested_type))
 
         return result
 
@@ -17,9 +17,10 @@ import base64
 import json
 import re
 import uuid
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address, ip_address
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Pattern, Union
 
 try:
     from varlord.logging import log_validation_error
@@ -46,6 +47,23 @@ class ValidationError(ValueError):
         super().__init__(f"Validation failed for '{key}' = {value!r}: {message}")
 
 
+# Patterns used by the built-in validators, compiled once at import time
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_WITH_SCHEME_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+_URL_RE = re.compile(r"^[^\s/$.?#].[^\s]*$")
+_DOMAIN_RE = re.compile(r"^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$")
+_PHONE_SEPARATORS_RE = re.compile(r"[\s\-\(\)]")
+_PHONE_CN_RE = re.compile(r"^1[3-9]\d{9}$")
+_PHONE_US_RE = re.compile(r"^[2-9]\d{2}[2-9]\d{2}\d{4}$")
+_PHONE_GENERIC_RE = re.compile(r"^\d{7,15}$")
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> Pattern[str]:
+    """Compile a user-supplied regex pattern, memoized by (pattern, flags)."""
+    return re.compile(pattern, flags)
+
+
 # ============================================================================
 # Basic Validators
 # ============================================================================
@@ -72,13 +90,14 @@ def validate_range(value: Any, min: Optional[float] = None, max: Optional[float]
         raise ValidationError("value", value, f"must be <= {max}")
 
 
-def validate_regex(value: str, pattern: str, flags: int = 0) -> None:
+def validate_regex(value: str, pattern: Union[str, Pattern[str]], flags: int = 0) -> None:
     r"""Validate that a string matches a regex pattern.
 
     Args:
         value: String to validate
-        pattern: Regex pattern
-        flags: Regex flags
+        pattern: Regex pattern, either as a string (compiled once and cached)
+                 or as an already compiled pattern
+        flags: Regex flags (only used for string patterns)
 
     Raises:
         ValidationError: If value doesn't match pattern
@@ -86,11 +105,16 @@ def validate_regex(value: str, pattern: str, flags: int = 0) -> None:
     Example:
         >>> validate_regex("abc123", r'^[a-z]+\d+$')  # OK
         >>> validate_regex("ABC123", r'^[a-z]+\d+$')  # Raises ValidationError
+        >>> validate_regex("abc123", re.compile(r'^[a-z]+\d+$'))  # OK
     """
     if not isinstance(value, str):
         raise ValidationError("value", value, "must be a string")
-    if not re.match(pattern, value, flags):
-        raise ValidationError("value", value, f"must match pattern {pattern!r}")
+    if isinstance(pattern, str):
+        compiled = _compile_pattern(pattern, flags)
+    else:
+        compiled = pattern
+    if not compiled.match(value):
+        raise ValidationError("value", value, f"must match pattern {compiled.pattern!r}")
 
 
 def validate_choice(value: Any, choices: list[Any]) -> None:
@@ -339,8 +363,7 @@ def validate_email(value: str) -> None:
     if not isinstance(value, str):
         raise ValidationError("value", value, "must be a string")
     # RFC 5322 compliant email regex (simplified)
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, value):
+    if not _EMAIL_RE.match(value):
         raise ValidationError("value", value, "must be a valid email address")
 
 
@@ -360,11 +383,8 @@ def validate_url(value: str, require_scheme: bool = True) -> None:
     """
     if not isinstance(value, str):
         raise ValidationError("value", value, "must be a string")
-    if require_scheme:
-        pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    else:
-        pattern = r"^[^\s/$.?#].[^\s]*$"
-    if not re.match(pattern, value):
+    pattern = _URL_WITH_SCHEME_RE if require_scheme else _URL_RE
+    if not pattern.match(value):
         scheme_msg = " with http:// or https:// scheme" if require_scheme else ""
         raise ValidationError("value", value, f"must be a valid URL{scheme_msg}")
 
@@ -454,8 +474,7 @@ def validate_domain(value: str) -> None:
     if not isinstance(value, str):
         raise ValidationError("value", value, "must be a string")
     # Domain name regex (RFC 1035)
-    pattern = r"^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
-    if not re.match(pattern, value):
+    if not _DOMAIN_RE.match(value):
         raise ValidationError("value", value, "must be a valid domain name")
 
 
@@ -478,15 +497,14 @@ def validate_phone(value: str, country: Optional[str] = None) -> None:
         raise ValidationError("value", value, "must be a string")
 
     # Remove common separators and check for + prefix
-    cleaned = re.sub(r"[\s\-\(\)]", "", value)
+    cleaned = _PHONE_SEPARATORS_RE.sub("", value)
     has_plus = cleaned.startswith("+")
     if has_plus:
         cleaned = cleaned[1:]  # Remove + for pattern matching
 
     if country == "CN":
         # Chinese mobile: 11 digits starting with 1
-        pattern = r"^1[3-9]\d{9}$"
-        if not re.match(pattern, cleaned):
+        if not _PHONE_CN_RE.match(cleaned):
             raise ValidationError(
                 "value", value, "must be a valid Chinese mobile number (11 digits starting with 1)"
             )
@@ -497,8 +515,7 @@ def validate_phone(value: str, country: Optional[str] = None) -> None:
             cleaned = cleaned[1:]  # Remove country code
         # US phone format: NXX-NXX-XXXX where N is 2-9
         if len(cleaned) == 10:
-            pattern = r"^[2-9]\d{2}[2-9]\d{2}\d{4}$"
-            if not re.match(pattern, cleaned):
+            if not _PHONE_US_RE.match(cleaned):
                 raise ValidationError(
                     "value",
                     value,
@@ -508,8 +525,7 @@ def validate_phone(value: str, country: Optional[str] = None) -> None:
             raise ValidationError("value", value, "must be a valid US phone number (10 digits)")
     else:
         # Generic: 7-15 digits, optionally with + prefix
-        pattern = r"^\d{7,15}$"
-        if not re.match(pattern, cleaned):
+        if not _PHONE_GENERIC_RE.match(cleaned):
             raise ValidationError("value", value, "must be a valid phone number (7-15 digits)")
 
 
@@ -796,6 +812,56 @@ def validate_custom(
         raise ValidationError("value", value, message)
 
 
+def compile_validators(
+    validators: dict[str, list[Callable[[Any], None]]],
+) -> Callable[[Any], None]:
+    """Build a reusable validation function from a validator mapping.
+
+    The mapping is frozen into a tuple once, so the returned function can be
+    created at module level and called from ``__post_init__`` for every
+    instance without rebuilding anything. Fields without validators are dropped.
+
+    Args:
+        validators: Dictionary mapping field names to lists of validator functions
+
+    Returns:
+        Function that takes a configuration object and raises ValidationError
+        if any validation fails (same semantics as apply_validators)
+
+    Example:
+        >>> _validate = compile_validators({
+        ...     "port": [validate_port],
+        ...     "host": [validate_not_empty],
+        ... })
+        >>> @dataclass
+        ... class Config:
+        ...     port: int = 8000
+        ...     host: str = "localhost"
+        ...
+        ...     def __post_init__(self):
+        ...         _validate(self)
+    """
+    plan = tuple(
+        (key, tuple(validator_list)) for key, validator_list in validators.items() if validator_list
+    )
+
+    def validate(config: Any) -> None:
+        for key, validator_list in plan:
+            try:
+                value = getattr(config, key)
+            except AttributeError:
+                continue
+            for validator in validator_list:
+                try:
+                    validator(value)
+                except ValidationError as e:
+                    e.key = key
+                    log_validation_error(key, value, e.message)
+                    raise
+
+    return validate
+
+
 def apply_validators(config: Any, validators: dict[str, list[Callable[[Any], None]]]) -> None:
     """Apply validators to a configuration object.
 
@@ -817,14 +883,4 @@ def apply_validators(config: Any, validators: dict[str, list[Callable[[Any], Non
         ...     "host": [lambda v: validate_not_empty(v)]
         ... })
     """
-    for key, validator_list in validators.items():
-        if not hasattr(config, key):
-            continue
-        value = getattr(config, key)
-        for validator in validator_list:
-            try:
-                validator(value)
-            except ValidationError as e:
-                e.key = key
-                log_validation_error(key, value, e.message)
-                raise
+    compile_validators(validators)(config)